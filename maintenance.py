@@ -19,6 +19,27 @@ from utils.database import (
 
 load_dotenv()
 
+# Upper bound for each embedding check query (milliseconds)
+EMBEDDING_CHECK_MAX_TIME_MS = 5000
+# Stop counting documents without embeddings past this many
+EMBEDDING_CHECK_LIMIT = 1000
+
+async def check_missing_embeddings(collection):
+    """Return a short report of how many documents in a collection lack an embedding"""
+    pipeline = [
+        {"$match": {"embedding": {"$exists": False}}},
+        {"$limit": EMBEDDING_CHECK_LIMIT},
+        {"$count": "missing"}
+    ]
+    result, total = await asyncio.gather(
+        collection.aggregate(pipeline, maxTimeMS=EMBEDDING_CHECK_MAX_TIME_MS).to_list(1),
+        collection.estimated_document_count(maxTimeMS=EMBEDDING_CHECK_MAX_TIME_MS)
+    )
+    missing = result[0]["missing"] if result else 0
+    if missing >= EMBEDDING_CHECK_LIMIT:
+        return f"{EMBEDDING_CHECK_LIMIT}+ (of ~{total})"
+    return f"{missing} (of ~{total})"
+
 async def check_collections():
     """Check all collections and ensure they exist with proper indexes"""
     print(f"[{datetime.now().isoformat()}] Starting database maintenance...")
@@ -30,10 +51,24 @@ async def check_collections():
         # Get the database
         db = Database.get_db()
         
+        # Resolve the collection handles once and reuse them below
+        jobs_collection = db[JOBS_COLLECTION]
+        candidates_collection = db[CANDIDATES_COLLECTION]
+        projects_collection = db[PROJECTS_COLLECTION]
+        
         print(f"Using database: {DATABASE_NAME}")
         
-        # List existing collections
-        collections = await db.list_collection_names()
+        # List existing collections. The embedding checks only need the collection
+        # handles, so run them in the same round of requests; they are reported
+        # further down. Check failures are kept as results so they don't abort the
+        # collection check.
+        collections, embedding_counts = await asyncio.gather(
+            db.list_collection_names(),
+            asyncio.gather(*[
+                check_missing_embeddings(collection)
+                for collection in (jobs_collection, candidates_collection, projects_collection)
+            ], return_exceptions=True)
+        )
         print(f"Found {len(collections)} collections: {', '.join(collections)}")
         
         # Expected collections
@@ -65,15 +100,11 @@ async def check_collections():
         # Verify embedding vectors
         # Check if any documents are missing embeddings
         try:
-            jobs_without_embedding = await Database.get_collection(JOBS_COLLECTION).count_documents(
-                {"embedding": {"$exists": False}}
-            )
-            candidates_without_embedding = await Database.get_collection(CANDIDATES_COLLECTION).count_documents(
-                {"embedding": {"$exists": False}}
-            )
-            projects_without_embedding = await Database.get_collection(PROJECTS_COLLECTION).count_documents(
-                {"embedding": {"$exists": False}}
-            )
+            for count in embedding_counts:
+                if isinstance(count, Exception):
+                    raise count
+            
+            jobs_without_embedding, candidates_without_embedding, projects_without_embedding = embedding_counts
             
             print(f"Jobs without embeddings: {jobs_without_embedding}")
             print(f"Candidates without embeddings: {candidates_without_embedding}")
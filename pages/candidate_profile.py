@@ -1,9 +1,8 @@
 import streamlit as st
 import requests
-import json
-import pandas as pd
+from requests.adapters import HTTPAdapter
 import re
-from datetime import datetime
+from datetime import date
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
@@ -17,68 +16,139 @@ if st.session_state.user_type != "candidate":
     st.warning("This page is only available for candidates")
     st.stop()
 
+# Auth headers are normally built at login; rebuild them for sessions that predate that
+if "auth_headers" not in st.session_state:
+    st.session_state.auth_headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {st.session_state.access_token}"
+    }
+
 # Initialize session state for profile data
 if "profile_data" not in st.session_state:
     st.session_state.profile_data = None
+# Tracks a successful load separately, since a new candidate's profile may be empty
+st.session_state.setdefault("profile_data_loaded", False)
+
+# Profile changes staged by the tab forms, sent together in one PATCH
+if "pending_patch" not in st.session_state:
+    st.session_state.pending_patch = {}
+
+# Validation patterns, compiled once per page load
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
 # Helper function for validation
 def validate_email(email):
     """Validate email format"""
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return EMAIL_PATTERN.match(email) is not None
 
 def validate_url(url):
-    """Validate URL format"""
-    pattern = r"^(https?:\/\/)?(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$"
-    return bool(re.match(pattern, url)) if url else True
-
-# Helper function
-def make_api_request(endpoint, method="GET", data=None, params=None):
-    """Make API request with proper headers and authentication"""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {st.session_state.access_token}"
-    }
+    """Validate URL format (optional http/https scheme, host and alphabetic TLD)"""
+    if not url:
+        return True
+    
+    value = url.strip().lower()
+    if not value or any(char.isspace() for char in value):
+        return False
     
-    url = f"{API_BASE_URL}/{endpoint}"
+    # Drop the scheme, then keep only the host part (no path, query, fragment or port)
+    if value.startswith(("http://", "https://")):
+        value = value.split("://", 1)[1]
+    host = value
+    for separator in "/?#":
+        host = host.split(separator, 1)[0]
+    host = host.rsplit(":", 1)[0] if ":" in host else host
     
+    name, _, tld = host.rpartition(".")
+    return bool(name) and tld.isalpha() and 2 <= len(tld) <= 6
+
+# Shared HTTP session so backend calls reuse pooled keep-alive connections
+@st.cache_resource
+def get_api_session():
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Cached across reruns, so unchanged inputs aren't re-parsed
+@st.cache_data(max_entries=64, show_spinner=False)
+def split_csv(text):
+    """Split a comma separated input into a tuple of trimmed, non-empty values"""
+    return tuple(item.strip() for item in text.split(",") if item.strip())
+
+# Fallback for missing or malformed dates in education/certification entries
+DEFAULT_DATE = date(2000, 1, 1)
+
+def parse_iso_date(value):
+    """Parse a YYYY-MM-DD string, falling back to DEFAULT_DATE"""
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
-        
-        if response.status_code in [200, 201, 204]:
-            return response.json() if response.content else {"message": "Success"}
-        else:
-            error_msg = response.json() if response.content else {"detail": "Unknown error"}
-            return {"error": f"Status {response.status_code}", "detail": error_msg}
-    except Exception as e:
-        return {"error": str(e)}
+        return date.fromisoformat(value) if value else DEFAULT_DATE
+    except (ValueError, TypeError):
+        return DEFAULT_DATE
+
+# Job types a candidate can choose from in their preferences
+JOB_TYPE_OPTIONS = ("Full-time", "Part-time", "Contract", "Remote", "Hybrid", "On-site")
+
+# Columns of the education and certification editors, in display order
+EDUCATION_COLUMNS = ("degree", "institution", "field", "start_date", "end_date", "gpa")
+CERTIFICATION_COLUMNS = ("name", "issuer", "issue_date", "expiry_date", "credential_id", "url")
+
+def entries_to_editor_rows(entries, columns, date_columns):
+    """Build a data editor DataFrame from profile entries, parsing their date strings"""
+    import pandas as pd
+    
+    rows = []
+    for entry in entries:
+        entry = entry or {}
+        rows.append({
+            column: parse_iso_date(entry.get(column)) if column in date_columns else entry.get(column, "")
+            for column in columns
+        })
+    return pd.DataFrame(rows, columns=list(columns))
 
-# Function to fetch profile data
-def fetch_profile_data():
+def editor_rows_to_entries(edited_df, date_columns):
+    """Turn edited data editor rows back into profile entries with YYYY-MM-DD dates"""
+    import pandas as pd
+    
+    entries = []
+    for row in edited_df.to_dict(orient="records"):
+        for column, value in row.items():
+            if column in date_columns:
+                # Rows added to an empty editor come back as strings rather than dates
+                parsed = pd.to_datetime(value, errors="coerce")
+                row[column] = (DEFAULT_DATE if pd.isna(parsed) else parsed.date()).strftime("%Y-%m-%d")
+            elif pd.isna(value):
+                row[column] = ""
+        entries.append(row)
+    return entries
+
+# Function to fetch profile data, cached per access token so revisiting the
+# page doesn't hit the backend again. Failures raise, so they are never cached.
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_profile_data(access_token):
+    response = get_api_session().get(
+        f"{API_BASE_URL}/profile",
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+    response.raise_for_status()
+    return response.json()
+
+def load_profile_data():
+    """Load profile data for the current user, reporting any failure on the page"""
     try:
-        response = requests.get(
-            "http://localhost:8000/profile",
-            headers={"Authorization": f"Bearer {st.session_state.access_token}"}
-        )
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Failed to fetch profile data: {response.status_code}")
-            return None
+        return fetch_profile_data(st.session_state.access_token)
+    except requests.HTTPError as e:
+        st.error(f"Failed to fetch profile data: {e.response.status_code}")
+        return None
     except Exception as e:
         st.error(f"Error fetching profile data: {str(e)}")
         return None
 
 # Fetch profile data if not in session state
-if not st.session_state.profile_data:
-    st.session_state.profile_data = fetch_profile_data()
+if not st.session_state.profile_data_loaded:
+    st.session_state.profile_data = load_profile_data()
+    st.session_state.profile_data_loaded = st.session_state.profile_data is not None
 
 # Get profile data from session state
 profile_data = st.session_state.profile_data
@@ -91,15 +161,17 @@ st.write("Complete your profile to improve job recommendations and help employer
 if profile_data is None:
     st.error("Failed to load profile data. Please try again.")
     if st.button("Retry Loading Profile"):
-        st.session_state.profile_data = fetch_profile_data()
+        fetch_profile_data.clear()
+        st.session_state.profile_data = load_profile_data()
+        st.session_state.profile_data_loaded = st.session_state.profile_data is not None
         st.rerun()
     st.stop()
 
-# Create tabs for different sections of the profile
-tabs = st.tabs(["Basic Information", "Skills & Experience", "Education", "Job Preferences", "Settings"])
-
+# Each tab is a fragment, so interacting with one tab's widgets only reruns that tab
 # Basic Information Tab
-with tabs[0]:
+@st.fragment
+def basic_info_tab(profile_data):
+    """Render the basic information form and handle its submission"""
     with st.form("basic_info_form"):
         st.subheader("Personal Information")
         
@@ -219,36 +291,31 @@ with tabs[0]:
         if validation_errors:
             for error in validation_errors:
                 st.error(error)
-        else:
-            # Build updated profile data
-            updated_profile = {
-                "full_name": full_name,
-                "phone": phone,
-                "location": location,
-                "experience_years": experience_years,
-                "bio": bio,
-                "about": about,
-                "links": {
-                    "linkedin": linkedin,
-                    "github": github,
-                    "portfolio": portfolio
-                }
+            return
+        
+        # Build updated profile data only once the input is known to be valid
+        updated_profile = {
+            "full_name": full_name,
+            "phone": phone,
+            "location": location,
+            "experience_years": str(experience_years),
+            "bio": bio,
+            "about": about,
+            "links": {
+                "linkedin": linkedin,
+                "github": github,
+                "portfolio": portfolio
             }
-            
-            # Send update request
-            with st.spinner("Updating profile..."):
-                result = make_api_request("profile", method="PUT", data=updated_profile)
-            
-            if "error" in result:
-                st.error(f"Failed to update profile: {result.get('error')}")
-                if "detail" in result:
-                    st.json(result.get("detail"))
-            else:
-                st.success("Basic information updated successfully!")
-                st.balloons()
+        }
+        
+        # Stage the changes; all staged sections are sent together by "Save all changes"
+        st.session_state.pending_patch.update(updated_profile)
+        st.info("Basic information changes staged. Click \"Save all changes\" in the sidebar to apply them.")
 
 # Skills & Experience Tab
-with tabs[1]:
+@st.fragment
+def skills_tab(profile_data):
+    """Render the skills form and handle its submission"""
     st.subheader("Skills")
     
     with st.form("skills_form"):
@@ -291,9 +358,27 @@ with tabs[1]:
         
         # Submit button
         skills_submit = st.form_submit_button("Update Skills")
+    
+    # Handle skills form submission
+    if skills_submit:
+        # Process skills data
+        skills_data = {
+            "skills": {
+                "languages_frameworks": split_csv(languages_frameworks_input),
+                "tools_platforms": split_csv(tools_platforms_input),
+                "ai_ml_data": split_csv(ai_ml_input),
+                "soft_skills": split_csv(soft_skills_input)
+            }
+        }
+    
+        # Stage the changes; all staged sections are sent together by "Save all changes"
+        st.session_state.pending_patch.update(skills_data)
+        st.info("Skills changes staged. Click \"Save all changes\" in the sidebar to apply them.")
 
 # Education & Certifications Tab
-with tabs[2]:
+@st.fragment
+def education_tab(profile_data):
+    """Render the education and certifications form and handle its submission"""
     st.subheader("Education")
     
     with st.form("education_form"):
@@ -308,144 +393,61 @@ with tabs[2]:
             height=100
         )
         
-        # Detailed education entries
+        # Detailed education entries, edited as one grid instead of a set of widgets per entry
         st.write("**Education History**")
-        education_entries = []
-        
-        # Display existing education entries and allow editing
-        for i, edu in enumerate(education_data):
-            st.write(f"Education Entry #{i+1}")
-            
-            # Get education entry safely
-            edu = edu or {}
-            
-            degree = st.text_input(
-                "Degree/Certificate*", 
-                value=edu.get("degree", ""),
-                key=f"degree_{i}"
-            )
-            
-            institution = st.text_input(
-                "Institution*", 
-                value=edu.get("institution", ""),
-                key=f"institution_{i}"
-            )
-            
-            field = st.text_input(
-                "Field of Study*", 
-                value=edu.get("field", ""),
-                key=f"field_{i}"
-            )
-            
-            # Handle date safely
-            try:
-                start_date = datetime.strptime(edu.get("start_date", "2000-01-01"), "%Y-%m-%d").date()
-            except (ValueError, TypeError):
-                start_date = datetime.strptime("2000-01-01", "%Y-%m-%d").date()
-                
-            try:
-                end_date = datetime.strptime(edu.get("end_date", "2000-01-01"), "%Y-%m-%d").date()
-            except (ValueError, TypeError):
-                end_date = datetime.strptime("2000-01-01", "%Y-%m-%d").date()
-            
-            start_date_input = st.date_input(
-                "Start Date*",
-                value=start_date,
-                key=f"start_date_{i}"
-            )
-            
-            end_date_input = st.date_input(
-                "End Date*",
-                value=end_date,
-                key=f"end_date_{i}"
-            )
-            
-            gpa = st.text_input(
-                "GPA", 
-                value=edu.get("gpa", ""),
-                key=f"gpa_{i}"
-            )
-            
-            education_entries.append({
-                "degree": degree,
-                "institution": institution,
-                "field": field,
-                "start_date": start_date_input.strftime("%Y-%m-%d"),
-                "end_date": end_date_input.strftime("%Y-%m-%d"),
-                "gpa": gpa
-            })
+        edited_education = st.data_editor(
+            entries_to_editor_rows(education_data, EDUCATION_COLUMNS, ("start_date", "end_date")),
+            column_config={
+                "degree": st.column_config.TextColumn("Degree/Certificate*"),
+                "institution": st.column_config.TextColumn("Institution*"),
+                "field": st.column_config.TextColumn("Field of Study*"),
+                "start_date": st.column_config.DateColumn("Start Date*", format="YYYY-MM-DD"),
+                "end_date": st.column_config.DateColumn("End Date*", format="YYYY-MM-DD"),
+                "gpa": st.column_config.TextColumn("GPA")
+            },
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            key="education_editor"
+        )
         
         # Certifications section
         st.subheader("Certifications")
         certifications = profile_data.get("certifications") or []
-        cert_entries = []
-        
-        for i, cert in enumerate(certifications):
-            st.write(f"Certification #{i+1}")
-            
-            # Get certification safely
-            cert = cert or {}
-            
-            name = st.text_input(
-                "Certification Name*", 
-                value=cert.get("name", ""),
-                key=f"cert_name_{i}"
-            )
-            
-            issuer = st.text_input(
-                "Issuing Organization*", 
-                value=cert.get("issuer", ""),
-                key=f"cert_issuer_{i}"
-            )
-            
-            # Handle dates safely
-            try:
-                issue_date = datetime.strptime(cert.get("issue_date", "2000-01-01"), "%Y-%m-%d").date()
-            except (ValueError, TypeError):
-                issue_date = datetime.strptime("2000-01-01", "%Y-%m-%d").date()
-                
-            try:
-                expiry_date = datetime.strptime(cert.get("expiry_date", "2000-01-01"), "%Y-%m-%d").date()
-            except (ValueError, TypeError):
-                expiry_date = datetime.strptime("2000-01-01", "%Y-%m-%d").date()
-            
-            issue_date_input = st.date_input(
-                "Issue Date*",
-                value=issue_date,
-                key=f"cert_date_{i}"
-            )
-            
-            expiry_date_input = st.date_input(
-                "Expiry Date (if applicable)",
-                value=expiry_date,
-                key=f"cert_expiry_{i}"
-            )
-            
-            credential_id = st.text_input(
-                "Credential ID", 
-                value=cert.get("credential_id", ""),
-                key=f"cert_id_{i}"
-            )
-            
-            cert_url = st.text_input(
-                "Credential URL", 
-                value=cert.get("url", ""),
-                key=f"cert_url_{i}"
-            )
-            
-            cert_entries.append({
-                "name": name,
-                "issuer": issuer,
-                "issue_date": issue_date_input.strftime("%Y-%m-%d"),
-                "expiry_date": expiry_date_input.strftime("%Y-%m-%d"),
-                "credential_id": credential_id,
-                "url": cert_url
-            })
+        edited_certifications = st.data_editor(
+            entries_to_editor_rows(certifications, CERTIFICATION_COLUMNS, ("issue_date", "expiry_date")),
+            column_config={
+                "name": st.column_config.TextColumn("Certification Name*"),
+                "issuer": st.column_config.TextColumn("Issuing Organization*"),
+                "issue_date": st.column_config.DateColumn("Issue Date*", format="YYYY-MM-DD"),
+                "expiry_date": st.column_config.DateColumn("Expiry Date (if applicable)", format="YYYY-MM-DD"),
+                "credential_id": st.column_config.TextColumn("Credential ID"),
+                "url": st.column_config.TextColumn("Credential URL")
+            },
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            key="certifications_editor"
+        )
         
         education_submit = st.form_submit_button("Update Education & Certifications")
+    
+    # Handle education form submission
+    if education_submit:
+        education_data = {
+            "education_summary": education_summary,
+            "education": editor_rows_to_entries(edited_education, ("start_date", "end_date")),
+            "certifications": editor_rows_to_entries(edited_certifications, ("issue_date", "expiry_date"))
+        }
+    
+        # Stage the changes; all staged sections are sent together by "Save all changes"
+        st.session_state.pending_patch.update(education_data)
+        st.info("Education and certifications changes staged. Click \"Save all changes\" in the sidebar to apply them.")
 
 # Job Preferences Tab
-with tabs[3]:
+@st.fragment
+def preferences_tab(profile_data):
+    """Render the job preferences form and handle its submission"""
     st.subheader("Job Preferences")
     
     with st.form("preferences_form"):
@@ -456,7 +458,7 @@ with tabs[3]:
         job_types = preferences.get("job_types") or []
         job_types_options = st.multiselect(
             "Preferred Job Types*",
-            options=["Full-time", "Part-time", "Contract", "Remote", "Hybrid", "On-site"],
+            options=JOB_TYPE_OPTIONS,
             default=job_types,
             help="Select all that apply"
         )
@@ -518,118 +520,75 @@ with tabs[3]:
         )
         
         preferences_submit = st.form_submit_button("Update Job Preferences")
-
-# Handle form submissions
-if "basic_info_submit" in locals() and basic_info_submit:
-    # Prepare basic info data
-    basic_data = {
-        "full_name": full_name,
-        "email": email,
-        "phone": phone,
-        "location": location,
-        "experience_years": str(experience_years),
-        "bio": bio,
-        "about": about,
-        "links": {
-            "linkedin": linkedin,
-            "github": github,
-            "portfolio": portfolio
-        }
-    }
     
-    try:
-        response = requests.patch(
-            "http://localhost:8000/profile",
-            headers={"Authorization": f"Bearer {st.session_state.access_token}"},
-            json=basic_data
-        )
-        if response.status_code == 200:
-            st.success("Basic information updated successfully!")
-            st.session_state.profile_data = None  # Force refresh
-            st.rerun()
-        else:
-            st.error(f"Failed to update basic information: {response.status_code}")
-    except Exception as e:
-        st.error(f"Error updating basic information: {str(e)}")
-
-# Handle skills form submission
-if "skills_submit" in locals() and skills_submit:
-    # Process skills data
-    skills_data = {
-        "skills": {
-            "languages_frameworks": [s.strip() for s in languages_frameworks_input.split(",") if s.strip()],
-            "tools_platforms": [s.strip() for s in tools_platforms_input.split(",") if s.strip()],
-            "ai_ml_data": [s.strip() for s in ai_ml_input.split(",") if s.strip()],
-            "soft_skills": [s.strip() for s in soft_skills_input.split(",") if s.strip()]
+    # Handle preferences form submission
+    if preferences_submit:
+        preferences_data = {
+            "job_preferences": {
+                "job_types": job_types_options,
+                "locations": split_csv(locations_input),
+                "industries": split_csv(industries_input),
+                "salary_range": {
+                    "min": min_salary,
+                    "max": max_salary
+                },
+                "notice_period": notice_period,
+                "willing_to_relocate": willing_to_relocate,
+                "travel_percentage": travel_preference
+            }
         }
-    }
-    
-    try:
-        response = requests.patch(
-            "http://localhost:8000/profile",
-            headers={"Authorization": f"Bearer {st.session_state.access_token}"},
-            json=skills_data
-        )
-        if response.status_code == 200:
-            st.success("Skills updated successfully!")
-            st.session_state.profile_data = None  # Force refresh
-            st.rerun()
-        else:
-            st.error(f"Failed to update skills: {response.status_code}")
-    except Exception as e:
-        st.error(f"Error updating skills: {str(e)}")
-
-# Handle education form submission
-if "education_submit" in locals() and education_submit:
-    education_data = {
-        "education_summary": education_summary,
-        "education": education_entries,
-        "certifications": cert_entries
-    }
     
-    try:
-        response = requests.patch(
-            "http://localhost:8000/profile",
-            headers={"Authorization": f"Bearer {st.session_state.access_token}"},
-            json=education_data
-        )
-        if response.status_code == 200:
-            st.success("Education and certifications updated successfully!")
-            st.session_state.profile_data = None  # Force refresh
-            st.rerun()
-        else:
-            st.error(f"Failed to update education: {response.status_code}")
-    except Exception as e:
-        st.error(f"Error updating education: {str(e)}")
-
-# Handle preferences form submission
-if "preferences_submit" in locals() and preferences_submit:
-    preferences_data = {
-        "job_preferences": {
-            "job_types": job_types_options,
-            "locations": [loc.strip() for loc in locations_input.split(",") if loc.strip()],
-            "industries": [ind.strip() for ind in industries_input.split(",") if ind.strip()],
-            "salary_range": {
-                "min": min_salary,
-                "max": max_salary
-            },
-            "notice_period": notice_period,
-            "willing_to_relocate": willing_to_relocate,
-            "travel_percentage": travel_preference
-        }
-    }
+        # Stage the changes; all staged sections are sent together by "Save all changes"
+        st.session_state.pending_patch.update(preferences_data)
+        st.info("Job preferences changes staged. Click \"Save all changes\" in the sidebar to apply them.")
+
+# Create tabs for different sections of the profile
+tabs = st.tabs(["Basic Information", "Skills & Experience", "Education", "Job Preferences", "Settings"])
+
+with tabs[0]:
+    basic_info_tab(profile_data)
+
+with tabs[1]:
+    skills_tab(profile_data)
+
+with tabs[2]:
+    education_tab(profile_data)
+
+with tabs[3]:
+    preferences_tab(profile_data)
+
+# Save all staged profile changes with a single request
+with st.sidebar:
+    if st.session_state.pending_patch:
+        st.caption("You have unsaved profile changes.")
     
-    try:
-        response = requests.patch(
-            "http://localhost:8000/profile",
-            headers={"Authorization": f"Bearer {st.session_state.access_token}"},
-            json=preferences_data
-        )
-        if response.status_code == 200:
-            st.success("Job preferences updated successfully!")
-            st.session_state.profile_data = None  # Force refresh
-            st.rerun()
+    if st.button("Save all changes"):
+        if not st.session_state.pending_patch:
+            st.info("No changes to save.")
         else:
-            st.error(f"Failed to update preferences: {response.status_code}")
-    except Exception as e:
-        st.error(f"Error updating preferences: {str(e)}") 
\ No newline at end of file
+            try:
+                response = get_api_session().patch(
+                    f"{API_BASE_URL}/profile",
+                    headers=st.session_state.auth_headers,
+                    json=st.session_state.pending_patch
+                )
+                if response.ok:
+                    st.success("Profile updated successfully!")
+                    # Apply the saved sections locally instead of rerunning and refetching;
+                    # the cached copy is dropped so the next cold load sees the new data
+                    st.session_state.profile_data = {
+                        **st.session_state.profile_data,
+                        **st.session_state.pending_patch
+                    }
+                    st.session_state.pending_patch = {}
+                    fetch_profile_data.clear()
+                else:
+                    # Decode the error body once; it may not be JSON
+                    try:
+                        error_msg = response.json()
+                    except ValueError:
+                        error_msg = {"detail": response.text or "Unknown error"}
+                    st.error(f"Failed to update profile: Status {response.status_code}")
+                    st.json(error_msg)
+            except Exception as e:
+                st.error(f"Error updating profile: {str(e)}")
@@ -1,12 +1,35 @@
 import streamlit as st
 import requests
-import json
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
+# Connect/read timeout in seconds for backend calls
+REQUEST_TIMEOUT = (3.05, 10)
+# Candidate fields shown in the recommendations table, in display order
+CANDIDATE_TABLE_COLUMNS = ("full_name", "location", "experience_years", "match_score")
+# Candidates requested per page of recommendations
+RECOMMENDATIONS_PAGE_SIZE = 20
+# Fields requested for the recommendations list. The backend doesn't send
+# bio_preview yet, so bio is requested too and truncated client-side until it does.
+RECOMMENDATION_FIELDS = "id,full_name,location,experience_years,match_score,skills,bio_preview,bio,education_summary"
+# Length of the bio shown on a card before the profile is opened
+BIO_PREVIEW_LENGTH = 200
+# Export formats offered for recommendations, with file extension and MIME type
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+}
+# Session state defaults for this page
+SESSION_DEFAULTS = {
+    "selected_job": None,
+    "selected_candidate": None,
+    "recommendation_threshold": 70,  # Default minimum match score
+    "page": 1
+}
 
 # Check authentication
 if "authenticated" not in st.session_state or not st.session_state.authenticated:
@@ -17,42 +40,122 @@ if st.session_state.user_type != "employer":
     st.warning("This page is only available for employers")
     st.stop()
 
-# Helper function
-def make_api_request(endpoint, method="GET", data=None, params=None):
-    """Make API request with proper headers and authentication"""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {st.session_state.access_token}"
+# Shared HTTP session so backend calls reuse pooled keep-alive connections.
+# Idempotent requests are retried with backoff when the backend is briefly unavailable.
+@st.cache_resource
+def get_api_session():
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Helper function for weights
+def normalize_weights(weights):
+    """Scale weights so they sum to 1.0, or return None if they are all zero"""
+    total = sum(weights.values())
+    if total <= 0:
+        return None
+    return {name: weight / total for name, weight in weights.items()}
+
+# Employer's active job postings, cached per access token so reruns triggered by
+# sliders and buttons don't hit the backend again. Failures raise, so they are never cached.
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_jobs(access_token):
+    response = get_api_session().get(
+        f"{API_BASE_URL}/jobs",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"employer_id": "current", "status": "Active"},
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+# One page of candidate recommendations for a job, cached on the query so reruns
+# that don't change the job, threshold, weights or page reuse the last result.
+# Weights are passed as a sorted tuple of items so the arguments stay hashable.
+@st.cache_data(ttl=120, show_spinner=False)
+def fetch_recommendations(access_token, job_id, min_score, weights=None, page=1):
+    params = {
+        "job_id": job_id,
+        "min_match_score": min_score,
+        "page": page,
+        "page_size": RECOMMENDATIONS_PAGE_SIZE,
+        "fields": RECOMMENDATION_FIELDS
     }
+    if weights:
+        params["weights"] = dict(weights)
+    response = get_api_session().get(
+        f"{API_BASE_URL}/candidates/recommendations",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params=params,
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+# Serialized once per set of recommendations and export format
+@st.cache_data(max_entries=16, show_spinner=False)
+def export_recommendations(candidates, export_format):
+    import pandas as pd
+    from io import BytesIO
     
-    url = f"{API_BASE_URL}/{endpoint}"
+    export_df = pd.json_normalize(candidates)
+    if export_format == "Excel":
+        buffer = BytesIO()
+        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+            export_df.to_excel(writer, index=False, sheet_name="Candidates")
+        return buffer.getvalue()
+    return export_df.to_csv(index=False).encode()
+
+# Full profile of a single candidate, fetched when the employer opens it
+@st.cache_data(ttl=120, show_spinner=False)
+def fetch_candidate_profile(access_token, candidate_id):
+    response = get_api_session().get(
+        f"{API_BASE_URL}/candidate/{candidate_id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+# Built once and reused across reruns. Takes no arguments while the distribution
+# is mock data; pass the real counts in once they come from the API.
+@st.cache_data(show_spinner=False)
+def build_match_distribution_figure():
+    # Imported here since the chart only renders when the stats expander is opened
+    import pandas as pd
+    import plotly.express as px
     
-    try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        
-        if response.status_code in [200, 201, 204]:
-            return response.json() if response.content else {"message": "Success"}
-        else:
-            error_msg = response.json() if response.content else {"detail": "Unknown error"}
-            return {"error": f"Status {response.status_code}", "detail": error_msg}
-    except Exception as e:
-        return {"error": str(e)}
-
-# Helper function for validation
-def validate_weights(skills_w, exp_w, edu_w, loc_w):
-    """Validate that weights sum to 1.0 and are valid"""
-    weights = [skills_w, exp_w, edu_w, loc_w]
-    if not all(0 <= w <= 1 for w in weights):
-        return False, "All weights must be between 0 and 1"
-    total = sum(weights)
-    if not 0.99 <= total <= 1.01:  # Allow small floating point differences
-        return False, f"Weights must sum to 1.0 (current sum: {total:.2f})"
-    return True, ""
+    match_df = pd.DataFrame({
+        "Range": ["90-100%", "80-89%", "70-79%", "60-69%", "50-59%", "< 50%"],
+        "Count": [8, 24, 47, 45, 62, 301]
+    })
+    return px.bar(
+        match_df,
+        x="Range",
+        y="Count",
+        title="Candidate Match Score Distribution",
+        color="Count",
+        color_continuous_scale="greens"
+    )
+
+def candidate_action_key(candidate_id):
+    """Session state key of a candidate's action picker"""
+    return f"candidate_action_{candidate_id}"
+
+def open_candidate_profile(candidate_id):
+    """Mark a candidate as opened when View Profile is picked"""
+    if st.session_state[candidate_action_key(candidate_id)] == "View Profile":
+        st.session_state.selected_candidate = candidate_id
+
+def current_weights():
+    """Return the applied match weights as a hashable tuple, or None if unset"""
+    if hasattr(st.session_state, 'weights'):
+        return tuple(sorted(st.session_state.weights.items()))
+    return None
 
 # Page title
 st.title("Candidate Recommendations")
@@ -63,24 +166,35 @@ Our advanced AI matching system analyzes candidate profiles and recommends the b
 matches for your job postings based on skills, experience, and preferences.
 """)
 
-# Initialize session state variables
-if "selected_job" not in st.session_state:
-    st.session_state.selected_job = None
-if "selected_candidate" not in st.session_state:
-    st.session_state.selected_candidate = None
-if "recommendation_threshold" not in st.session_state:
-    st.session_state.recommendation_threshold = 70  # Default minimum match score
-
-# Add form validation state to session
-if "form_validation_error" not in st.session_state:
-    st.session_state.form_validation_error = None
+# Initialize session state variables in one update
+st.session_state.update({
+    key: value for key, value in SESSION_DEFAULTS.items() if key not in st.session_state
+})
 
 # Get employer's active job postings for the dropdown
-with st.spinner("Loading job postings..."):
-    jobs_response = make_api_request("jobs", params={"employer_id": "current", "status": "Active"})
-
-    if "error" in jobs_response:
-        st.error(f"Failed to load job postings: {jobs_response.get('error')}")
+with st.spinner("Loading job postings..."), ThreadPoolExecutor(max_workers=2) as executor:
+    jobs_future = executor.submit(fetch_jobs, st.session_state.access_token)
+    
+    # Warm the recommendations cache for the last selected job while the jobs load.
+    # If the user picks another job the prefetched result is just left unused, and
+    # a failed prefetch is retried by the regular fetch further down.
+    if st.session_state.selected_job is not None:
+        executor.submit(
+            fetch_recommendations,
+            st.session_state.access_token,
+            st.session_state.selected_job,
+            st.session_state.recommendation_threshold,
+            current_weights(),
+            st.session_state.page
+        )
+    
+    try:
+        jobs_response = jobs_future.result()
+    except requests.HTTPError as e:
+        st.error(f"Failed to load job postings: Status {e.response.status_code}")
+        st.stop()
+    except Exception as e:
+        st.error(f"Failed to load job postings: {str(e)}")
         st.stop()
 
     # Extract jobs from the response
@@ -99,8 +213,17 @@ if not jobs:
     
     st.stop()
 
+# Index the jobs by id for the selector, rebuilding only when the jobs payload changes
+# (hashing the whole payload, so edited titles, skills or locations are picked up)
+jobs_hash = hash(orjson.dumps(jobs))
+if st.session_state.get("jobs_hash") != jobs_hash:
+    st.session_state.jobs_by_id = {job.get('id'): job for job in jobs}
+    st.session_state.job_options = {f"{job.get('title')} ({job.get('id')})": job.get('id') for job in jobs}
+    st.session_state.jobs_hash = jobs_hash
+jobs_by_id = st.session_state.jobs_by_id
+job_options = st.session_state.job_options
+
 # Create a job selector dropdown
-job_options = {f"{job.get('title')} ({job.get('id')})": job.get('id') for job in jobs}
 selected_job_title = st.selectbox(
     "Select a job posting to view candidate recommendations:",
     options=list(job_options.keys())
@@ -111,7 +234,109 @@ selected_job_id = job_options[selected_job_title]
 st.session_state.selected_job = selected_job_id
 
 # Get selected job details
-selected_job = next((job for job in jobs if job.get('id') == selected_job_id), None)
+selected_job = jobs_by_id.get(selected_job_id)
+
+# Sidebar with filters, additional actions and information. The threshold and filters
+# sit in one form, so dragging a slider doesn't rerun the page and refetch
+# recommendations until the filters are applied.
+with st.sidebar:
+    st.subheader("Filter Candidates")
+    
+    with st.form("filters"):
+        # Minimum match score threshold
+        min_match_score = st.slider(
+            "Minimum Match Score",
+            min_value=0,
+            max_value=100,
+            value=st.session_state.recommendation_threshold,
+            step=5
+        )
+        
+        # Experience filter
+        experience_range = st.slider(
+            "Experience (years)",
+            min_value=0,
+            max_value=20,
+            value=(0, 20),
+            key="filter_experience"
+        )
+        
+        # Skills filter
+        required_skills = st.text_input(
+            "Required Skills",
+            help="Comma-separated list of required skills",
+            key="filter_skills"
+        )
+        
+        # Location filter
+        location = st.text_input(
+            "Location",
+            help="Filter by candidate location",
+            key="filter_location"
+        )
+        
+        # Education Level filter
+        education_level = st.multiselect(
+            "Education Level",
+            ["Bachelor's", "Master's", "PhD", "Other"],
+            key="filter_education"
+        )
+        
+        # Apply filters button
+        st.form_submit_button("Apply")
+    
+    st.session_state.recommendation_threshold = min_match_score
+    
+    st.subheader("Quick Actions")
+    
+    # Recommendation settings
+    with st.expander("Recommendation Settings", expanded=False):
+        st.write("Adjust how candidates are matched to your jobs")
+        
+        # These would typically be saved to the employer's profile
+        auto_contact = st.toggle("Auto-contact candidates above 90% match", value=False)
+        daily_digest = st.toggle("Receive daily recommendation digests", value=True)
+        
+        if st.button("Save Preferences"):
+            st.success("Preferences saved successfully!")
+    
+    # Export options
+    st.subheader("Export Options")
+    export_format = st.selectbox("Export Format", list(EXPORT_FORMATS))
+    # Filled in with the download button once the recommendations are loaded
+    export_container = st.container()
+    
+    # Help and resources
+    st.subheader("Resources")
+    st.markdown("[Matching Algorithm Explanation](https://example.com)")
+    st.markdown("[Best Practices for Hiring](https://example.com)")
+    st.markdown("[Candidate Engagement Guide](https://example.com)")
+    
+    # Recommendation quality feedback with validation
+    st.subheader("Feedback")
+    with st.form("feedback_form"):
+        recommendation_quality = st.slider(
+            "Recommendation Quality", 
+            1, 5, 4,
+            help="Rate the quality of recommendations from 1 (poor) to 5 (excellent)"
+        )
+        feedback = st.text_area(
+            "How can we improve recommendations?",
+            help="Please provide specific feedback to help us improve"
+        )
+        
+        submit_feedback = st.form_submit_button("Submit Feedback")
+        
+        if submit_feedback:
+            if len(feedback.strip()) < 10:
+                st.error("Please provide more detailed feedback (at least 10 characters)")
+            else:
+                # This would send feedback to the API
+                try:
+                    # Add API call here
+                    st.success("Thank you for your feedback!")
+                except Exception as e:
+                    st.error(f"Failed to submit feedback: {str(e)}")
 
 # Create two columns layout
 col1, col2 = st.columns([1, 3])
@@ -129,14 +354,13 @@ with col1:
         if "skills" in selected_job:
             skills = selected_job["skills"]
             
+            # Each list is rendered as one markdown element rather than one per skill
             st.write("**Required Skills:**")
-            for skill in skills.get("required", []):
-                st.markdown(f"- {skill}")
+            st.markdown("\n".join(f"- {skill}" for skill in skills.get("required", [])))
             
             if skills.get("preferred", []):
                 st.write("**Preferred Skills:**")
-                for skill in skills.get("preferred", []):
-                    st.markdown(f"- {skill}")
+                st.markdown("\n".join(f"- {skill}" for skill in skills["preferred"]))
     
     # Add a divider
     st.divider()
@@ -144,16 +368,6 @@ with col1:
     # Recommendation settings
     st.subheader("Recommendation Settings")
     
-    # Minimum match score threshold
-    min_match_score = st.slider(
-        "Minimum Match Score",
-        min_value=0,
-        max_value=100,
-        value=st.session_state.recommendation_threshold,
-        step=5
-    )
-    st.session_state.recommendation_threshold = min_match_score
-    
     # Recommendation preferences
     st.subheader("Match Preferences")
     
@@ -169,34 +383,24 @@ with col1:
                                   help="Weight given to location match in the overall score")
         
         # Add a note about weights
-        st.info("Note: The sum of all weights must equal 1.0")
-        
-        # Show current sum of weights
-        total_weight = skills_weight + experience_weight + education_weight + location_weight
-        st.write(f"Current total weight: {total_weight:.2f}")
+        st.info("Note: Weights are scaled to sum to 1.0 when applied")
         
         # Apply settings button
         submit_settings = st.form_submit_button("Apply Settings")
         
         if submit_settings:
-            # Validate weights
-            is_valid, error_msg = validate_weights(
-                skills_weight, experience_weight, 
-                education_weight, location_weight
-            )
+            weights = normalize_weights({
+                "skills": skills_weight,
+                "experience": experience_weight,
+                "education": education_weight,
+                "location": location_weight
+            })
             
-            if not is_valid:
-                st.error(error_msg)
-                st.session_state.form_validation_error = error_msg
+            if weights is None:
+                st.error("At least one weight must be greater than 0")
             else:
-                st.session_state.form_validation_error = None
                 # Store the weights for the API call
-                st.session_state.weights = {
-                    "skills": skills_weight,
-                    "experience": experience_weight,
-                    "education": education_weight,
-                    "location": location_weight
-                }
+                st.session_state.weights = weights
                 st.success("Settings applied successfully!")
 
     # Talent pool insights
@@ -209,120 +413,103 @@ with col1:
         st.metric("Above 80% Match", "32")
         st.metric("Above 60% Match", "124")
         
-        # Create a simple histogram of match scores
-        match_data = {
-            "Range": ["90-100%", "80-89%", "70-79%", "60-69%", "50-59%", "< 50%"],
-            "Count": [8, 24, 47, 45, 62, 301]
-        }
-        match_df = pd.DataFrame(match_data)
-        
-        fig = px.bar(
-            match_df,
-            x="Range",
-            y="Count",
-            title="Candidate Match Score Distribution",
-            color="Count",
-            color_continuous_scale="greens"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        # Simple histogram of match scores
+        st.plotly_chart(build_match_distribution_figure(), use_container_width=True)
 
 # Get candidate recommendations
 with col2:
-    # Initialize search parameters
-    params = {
-        "job_id": selected_job_id,
-        "min_match_score": min_match_score
-    }
-    
-    # Add weights if settings were applied and valid
-    if hasattr(st.session_state, 'weights') and not st.session_state.form_validation_error:
-        params["weights"] = st.session_state.weights
+    # Force a reload past the cached results
+    if st.button("Refresh", key="refresh_recommendations"):
+        fetch_recommendations.clear()
+        st.session_state.pop("last_rec_key", None)
     
-    # Get candidate recommendations
-    with st.spinner("Finding the best candidates for your job..."):
+    # Get candidate recommendations. Reruns from UI-only buttons keep the same query,
+    # so the stored results are reused without going through the fetch at all.
+    page = st.session_state.page
+    rec_key = (selected_job_id, min_match_score, current_weights(), page)
+    recommendations = None
+    if st.session_state.get("last_rec_key") == rec_key:
+        recommendations = st.session_state.search_results
+    else:
         try:
-            recommendations = make_api_request("candidates/recommendations", params=params)
-            
-            if "error" in recommendations:
-                st.error(f"Failed to load recommendations: {recommendations.get('error')}")
-                if st.button("Retry Search"):
-                    st.rerun()
-            else:
-                st.session_state.search_results = recommendations
-                st.success(f"Found {len(recommendations.get('candidates', []))} matching candidates")
+            with st.spinner("Finding the best candidates for your job..."):
+                recommendations = fetch_recommendations(
+                    st.session_state.access_token, *rec_key
+                )
+            st.session_state.search_results = recommendations
+            st.session_state.last_rec_key = rec_key
+        except requests.HTTPError as e:
+            st.error(f"Failed to load recommendations: Status {e.response.status_code}")
+            if st.button("Retry Search"):
+                st.rerun()
         except Exception as e:
             st.error(f"An error occurred while searching: {str(e)}")
             if st.button("Retry Search"):
                 st.rerun()
+    
+    # Extract the current page of candidates from the response
+    total_pages = 1
+    if isinstance(recommendations, dict):
+        candidates = recommendations.get("candidates", [])
+        total_pages = recommendations.get("total_pages", 1)
+    else:
+        candidates = recommendations or []
+    
+    if recommendations is not None:
+        st.success(f"Found {len(candidates)} matching candidates")
 
     # Display results
     if st.session_state.selected_candidate:
         # Back button
         if st.button("Back to Results"):
+            st.session_state.pop(candidate_action_key(st.session_state.selected_candidate), None)
             st.session_state.selected_candidate = None
 
-# Add a sidebar with additional actions and information
-with st.sidebar:
-    st.subheader("Quick Actions")
-    
-    # Recommendation settings
-    with st.expander("Recommendation Settings", expanded=False):
-        st.write("Adjust how candidates are matched to your jobs")
-        
-        # These would typically be saved to the employer's profile
-        auto_contact = st.toggle("Auto-contact candidates above 90% match", value=False)
-        daily_digest = st.toggle("Receive daily recommendation digests", value=True)
-        
-        if st.button("Save Preferences"):
-            st.success("Preferences saved successfully!")
-    
-    # Export options
-    st.subheader("Export Options")
-    export_format = st.selectbox("Export Format", ["CSV", "Excel", "PDF"])
-    
-    if st.button("Export Recommendations"):
-        st.success(f"Recommendations exported as {export_format}")
-    
-    # Help and resources
-    st.subheader("Resources")
-    st.markdown("[Matching Algorithm Explanation](https://example.com)")
-    st.markdown("[Best Practices for Hiring](https://example.com)")
-    st.markdown("[Candidate Engagement Guide](https://example.com)")
-    
-    # Recommendation quality feedback with validation
-    st.subheader("Feedback")
-    with st.form("feedback_form"):
-        recommendation_quality = st.slider(
-            "Recommendation Quality", 
-            1, 5, 4,
-            help="Rate the quality of recommendations from 1 (poor) to 5 (excellent)"
+# Export the loaded recommendations. The file bytes are cached per result set,
+# so clicking download doesn't serialize anything.
+with export_container:
+    if candidates:
+        file_extension, mime_type = EXPORT_FORMATS[export_format]
+        st.download_button(
+            f"Export {export_format}",
+            data=export_recommendations(candidates, export_format),
+            file_name=f"candidates.{file_extension}",
+            mime=mime_type
         )
-        feedback = st.text_area(
-            "How can we improve recommendations?",
-            help="Please provide specific feedback to help us improve"
-        )
-        
-        submit_feedback = st.form_submit_button("Submit Feedback")
-        
-        if submit_feedback:
-            if len(feedback.strip()) < 10:
-                st.error("Please provide more detailed feedback (at least 10 characters)")
-            else:
-                # This would send feedback to the API
-                try:
-                    # Add API call here
-                    st.success("Thank you for your feedback!")
-                except Exception as e:
-                    st.error(f"Failed to submit feedback: {str(e)}")
+    else:
+        st.caption("Load recommendations to export them.")
 
-# Display candidate recommendations
-if recommendations:
-    for idx, candidate in enumerate(recommendations):
-        with st.container():
+# Display candidate recommendations as one table; the detail card is only
+# rendered for the row the user selects
+if candidates:
+    import pandas as pd
+    
+    candidate_df = pd.json_normalize(candidates)
+    table_columns = [column for column in CANDIDATE_TABLE_COLUMNS if column in candidate_df.columns]
+    candidate_table = st.dataframe(
+        candidate_df[table_columns],
+        column_config={
+            "full_name": st.column_config.TextColumn("Candidate"),
+            "location": st.column_config.TextColumn("Location"),
+            "experience_years": st.column_config.NumberColumn("Experience (years)"),
+            "match_score": st.column_config.ProgressColumn(
+                "Match Score", min_value=0, max_value=100, format="%d%%"
+            )
+        },
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="candidate_table"
+    )
+    
+    selected_rows = candidate_table.selection.rows
+    if selected_rows:
+        idx = selected_rows[0]
+        candidate = candidates[idx]
+        with st.expander(candidate.get('full_name', 'Anonymous Candidate'), expanded=True):
             col1, col2 = st.columns([3, 1])
             with col1:
-                st.markdown(f"### {candidate.get('full_name', 'Anonymous Candidate')}")
                 st.write(f"**Location:** {candidate.get('location', 'N/A')}")
                 st.write(f"**Experience:** {candidate.get('experience_years', 'N/A')} years")
                 st.write(f"**Match Score:** {candidate.get('match_score', 'N/A')}%")
@@ -340,74 +527,46 @@ if recommendations:
                         st.write("**Soft Skills:**")
                         st.write(", ".join(soft_skills))
                 
-                # Display bio preview
-                bio = candidate.get('bio', '')
+                # Display the bio preview, or the full bio once the profile is opened
+                bio = candidate.get('bio_preview')
+                if not bio:
+                    full_bio = candidate.get('bio', '')
+                    bio = full_bio[:BIO_PREVIEW_LENGTH] + "..." if len(full_bio) > BIO_PREVIEW_LENGTH else full_bio
+                candidate_id = candidate.get('id')
+                if candidate_id is not None and st.session_state.selected_candidate == candidate_id:
+                    try:
+                        bio = fetch_candidate_profile(st.session_state.access_token, candidate_id).get('bio') or bio
+                    except Exception as e:
+                        st.error(f"Failed to load the full profile: {str(e)}")
                 if bio:
                     st.write("**Professional Summary:**")
-                    preview = bio[:200] + "..." if len(bio) > 200 else bio
-                    st.write(preview)
+                    st.write(bio)
             
             with col2:
-                # Use index as fallback for unique keys
-                candidate_id = candidate.get('id')
-                view_key = f"view_{candidate_id if candidate_id is not None else f'idx_{idx}'}"
-                contact_key = f"contact_{candidate_id if candidate_id is not None else f'idx_{idx}'}"
-                save_key = f"save_{candidate_id if candidate_id is not None else f'idx_{idx}'}"
-                
-                st.button("View Profile", key=view_key)
-                st.button("Contact", key=contact_key)
-                st.button("Save Profile", key=save_key)
+                # One action picker for the selected candidate instead of a button per action
+                # Opening the profile is handled in a callback, so the card above
+                # already shows the full profile on the rerun it triggers. Keyed per
+                # candidate, so selecting another row doesn't carry the last pick over.
+                action_candidate_id = candidate.get('id', idx)
+                st.segmented_control(
+                    "Action",
+                    ["View Profile", "Contact", "Save Profile"],
+                    key=candidate_action_key(action_candidate_id),
+                    label_visibility="collapsed",
+                    on_change=open_candidate_profile,
+                    args=(action_candidate_id,)
+                )
             
             # Add education if available
             education = candidate.get('education_summary')
             if education:
                 st.write("**Education:**")
                 st.write(education)
-            
-            st.divider()
 else:
     st.info("No candidate recommendations found. Post a job to get matched candidates.")
 
-# Filters sidebar
-with st.sidebar:
-    st.subheader("Filter Candidates")
-    
-    # Experience filter
-    experience_range = st.slider(
-        "Experience (years)",
-        min_value=0,
-        max_value=20,
-        value=(0, 20),
-        key="filter_experience"
-    )
-    
-    # Skills filter
-    required_skills = st.text_input(
-        "Required Skills",
-        help="Comma-separated list of required skills",
-        key="filter_skills"
-    )
-    
-    # Location filter
-    location = st.text_input(
-        "Location",
-        help="Filter by candidate location",
-        key="filter_location"
-    )
-    
-    # Education Level filter
-    education_level = st.multiselect(
-        "Education Level",
-        ["Bachelor's", "Master's", "PhD", "Other"],
-        key="filter_education"
-    )
-    
-    # Apply filters button
-    if st.button("Apply Filters", key="apply_filters"):
-        st.rerun()
-
 # Pagination controls
-if recommendations:
+if candidates:
     col1, col2, col3 = st.columns([1, 2, 1])
     with col1:
         if page > 1:
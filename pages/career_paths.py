@@ -1,14 +1,48 @@
 import streamlit as st
 import requests
-import json
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
-import numpy as np
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
+# Connect/read timeout in seconds for backend calls
+REQUEST_TIMEOUT = (2, 10)
+# Most entries requested for the job role and industry selectboxes
+REFERENCE_LIST_LIMIT = 1000
+
+# Sample skills shown until the skill development endpoint exists
+SAMPLE_SKILLS = (
+    {"name": "System Architecture", "demand_score": 8, "growth_trend": 15, "category": "Technical"},
+    {"name": "Cloud Services (AWS/Azure)", "demand_score": 9, "growth_trend": 20, "category": "Technical"},
+    {"name": "CI/CD Pipelines", "demand_score": 7, "growth_trend": 12, "category": "DevOps"},
+    {"name": "Team Leadership", "demand_score": 8, "growth_trend": 10, "category": "Soft Skills"},
+    {"name": "Microservices", "demand_score": 8, "growth_trend": 18, "category": "Architecture"}
+)
+
+# Mock learning resources (these would normally come from the API)
+SAMPLE_COURSES = (  # (title, provider, link)
+    ("Leadership in Tech", "Coursera", "https://coursera.org"),
+    ("Advanced Cloud Architecture", "Udemy", "https://udemy.com"),
+    ("System Design for Senior Engineers", "edX", "https://edx.org")
+)
+SAMPLE_BOOKS = (  # (title, author)
+    ("The Manager's Path", "Camille Fournier"),
+    ("Designing Data-Intensive Applications", "Martin Kleppmann"),
+    ("Staff Engineer: Leadership Beyond the Management Track", "Will Larson")
+)
+SAMPLE_COMMUNITIES = (  # (name, type)
+    ("Tech Leadership Network", "Online Forum"),
+    ("Senior Engineers Hub", "Slack Community"),
+    ("Women in Tech Leadership", "Networking Group")
+)
+SAMPLE_CERTIFICATIONS = (  # (name, organization)
+    ("AWS Solutions Architect", "Amazon Web Services"),
+    ("Google Cloud Professional Engineer", "Google"),
+    ("Project Management Professional (PMP)", "PMI")
+)
 
 # Check authentication
 if "authenticated" not in st.session_state or not st.session_state.authenticated:
@@ -19,32 +53,161 @@ if st.session_state.user_type != "candidate":
     st.warning("This page is only available for candidates")
     st.stop()
 
+# Shared HTTP session so backend calls, including the concurrent ones, reuse
+# pooled keep-alive connections
+@st.cache_resource
+def get_api_session():
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    # Transient gateway errors are retried with backoff. POST is left out since the
+    # backend may already have acted on it (e.g. recorded the feedback).
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "PUT"})
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def send_request(method, endpoint, access_token, params=None, data=None):
+    """Send a request to the backend with the caller's bearer token"""
+    return get_api_session().request(
+        method,
+        f"{API_BASE_URL}/{endpoint}",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params=params,
+        json=data,
+        timeout=REQUEST_TIMEOUT
+    )
+
+# GET responses are cached per endpoint, params and token, since the page reruns on
+# every widget change. Params come in as a sorted tuple of items so they hash.
+# Failures raise, so they are never cached.
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_get(endpoint, params, access_token):
+    response = send_request("GET", endpoint, access_token, params=dict(params) if params else None)
+    response.raise_for_status()
+    return decode_body(response, {"message": "Success"})
+
+def decode_body(response, default):
+    """Decode a JSON response body with orjson, or return default when it is empty"""
+    body = response.content
+    if not body:
+        return default
+    return orjson.loads(body)
+
+def error_result(response):
+    """Build the error dict returned for a failed response"""
+    try:
+        error_msg = decode_body(response, {"detail": "Unknown error"})
+    except orjson.JSONDecodeError:
+        error_msg = {"detail": response.text}
+    return {"error": f"Status {response.status_code}", "detail": error_msg}
+
 # Helper function
-def make_api_request(endpoint, method="GET", data=None, params=None):
+def make_api_request(endpoint, method="GET", data=None, params=None, access_token=None):
     """Make API request with proper headers and authentication"""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {st.session_state.access_token}"
-    }
-    
-    url = f"{API_BASE_URL}/{endpoint}"
+    # Worker threads can't read session state, so they pass the token in
+    if access_token is None:
+        access_token = st.session_state.access_token
     
     try:
+        # Only GETs are cached; writes such as the feedback POST always go out
         if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
+            return cached_get(endpoint, tuple(sorted(params.items())) if params else None, access_token)
         
+        response = send_request(method, endpoint, access_token, params=params, data=data)
         if response.status_code in [200, 201, 204]:
-            return response.json() if response.content else {"message": "Success"}
-        else:
-            error_msg = response.json() if response.content else {"detail": "Unknown error"}
-            return {"error": f"Status {response.status_code}", "detail": error_msg}
+            return decode_body(response, {"message": "Success"})
+        return error_result(response)
+    except requests.HTTPError as e:
+        return error_result(e.response)
+    except requests.Timeout:
+        return {"error": "timeout"}
     except Exception as e:
         return {"error": str(e)}
 
+# Node colours run from the first step's colour to the last step's
+PATH_START_COLOR = "#4285F4"
+PATH_END_COLOR = "#EA4335"
+
+def path_colors(n):
+    """Blend PATH_START_COLOR into PATH_END_COLOR across n steps, in one pass"""
+    start = [int(PATH_START_COLOR[k:k+2], 16) for k in (1, 3, 5)]
+    end = [int(PATH_END_COLOR[k:k+2], 16) for k in (1, 3, 5)]
+    span = max(n - 1, 1)
+    return [
+        "#" + "".join(f"{round(a + (b - a) * j / span):02x}" for a, b in zip(start, end))
+        for j in range(n)
+    ]
+
+def path_dot(roles):
+    """Build a Graphviz DOT graph of a career path as a left-to-right chain of roles"""
+    n = len(roles)
+    lines = ["digraph G {", "rankdir=LR;", 'node [shape=box, style="filled,rounded", fontcolor=white];']
+    for j, (role, color) in enumerate(zip(roles, path_colors(n))):
+        label = str(role).replace('"', '\\"')
+        lines.append(f'{j} [label="{label}", fillcolor="{color}"];')
+    lines.extend(f"{j} -> {j+1};" for j in range(n - 1))
+    lines.append("}")
+    return "\n".join(lines)
+
+# The tables below are cached on their source data (st.cache_data hashes the
+# lists of dicts), so reruns that don't change the paths or skills reuse the DataFrame
+@st.cache_data(show_spinner=False)
+def build_comparison(paths):
+    """Build the path comparison table from the career paths"""
+    return pd.DataFrame.from_records([
+        {
+            "Path": path.get("name", f"Path {p+1}"),
+            "Avg. Time (Years)": path.get("average_time_years", "N/A"),
+            "Salary Growth": f"{path.get('salary_growth_percentage', 'N/A')}%",
+            "Difficulty (1-10)": path.get("difficulty", "N/A"),
+            "Steps": len(path.get("steps", [])),
+            "End Role": path.get("steps", [])[-1].get("role", "N/A") if path.get("steps", []) else "N/A"
+        }
+        for p, path in enumerate(paths)
+    ])
+
+@st.cache_data(show_spinner=False)
+def build_skill_table(skills):
+    """Build the skill recommendations table from the skills"""
+    return pd.DataFrame.from_records([
+        {
+            "Skill": skill.get("name", ""),
+            "Demand Score": skill.get("demand_score", 0),
+            "Growth Trend": f"{skill.get('growth_trend', 0)}%",
+            "Category": skill.get("category", "Technical")
+        }
+        for skill in skills
+    ])
+
+def load_static_refs(access_token):
+    """Fetch the profile, job roles and industries concurrently"""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        return tuple(executor.map(
+            lambda request: make_api_request(request[0], params=request[1], access_token=access_token),
+            [
+                ("profile", None),
+                # Only the names are used, for the selectboxes
+                ("job-roles", {"fields": "title", "limit": REFERENCE_LIST_LIMIT}),
+                ("industries", {"fields": "name", "limit": REFERENCE_LIST_LIMIT})
+            ]
+        ))
+
+# Background workers for feedback submissions, shared across reruns
+@st.cache_resource
+def get_feedback_executor():
+    return ThreadPoolExecutor(max_workers=2)
+
+@st.cache_data(show_spinner=False)
+def build_option_index(options):
+    """Map each option to its position, for selectbox default lookups"""
+    return {option: idx for idx, option in enumerate(options)}
+
 # Set page title
 st.title("Career Path Explorer")
 
@@ -54,8 +217,8 @@ Discover possible career paths based on your current profile and interests.
 Explore different roles, required skills, and typical progression timelines.
 """)
 
-# Get profile data
-profile = make_api_request("profile")
+# Get profile data, job roles and industries; none of them depend on the others
+profile, job_roles, industries_data = load_static_refs(st.session_state.access_token)
 if "error" in profile:
     st.error("Failed to load your profile data.")
     profile = {}
@@ -66,8 +229,7 @@ with col1:
     # Extract current role from profile or allow selection
     default_role = profile.get("current_role", "Software Engineer")
     
-    # Get job roles from API
-    job_roles = make_api_request("job-roles")
+    # Job roles from API
     if "error" not in job_roles:
         # Handle both list and dictionary responses
         if isinstance(job_roles, list):
@@ -78,7 +240,7 @@ with col1:
         current_role = st.selectbox(
             "Your Current Role:",
             options=role_options,
-            index=role_options.index(default_role) if default_role in role_options else 0
+            index=build_option_index(tuple(role_options)).get(default_role, 0)
         )
     else:
         # Fallback if API fails
@@ -98,8 +260,7 @@ with col1:
         )
 
 with col2:
-    # Get industries from API
-    industries_data = make_api_request("industries")
+    # Industries from API
     if "error" not in industries_data:
         # Handle both list and dictionary responses
         if isinstance(industries_data, list):
@@ -140,16 +301,27 @@ career_goal = st.selectbox(
     ]
 )
 
-# Load career path data
-with st.spinner("Loading career paths..."):
-    career_paths = make_api_request(
+# Load career path data and skill recommendations. Both only depend on the
+# selections above, so they are requested concurrently.
+with st.spinner("Loading career paths..."), ThreadPoolExecutor(max_workers=2) as executor:
+    career_paths_future = executor.submit(
+        make_api_request,
         "recommendations/career-path", 
         params={
             "current_role": current_role,
             "industry": current_industry,
             "career_goal": career_goal
-        }
+        },
+        access_token=st.session_state.access_token
+    )
+    skill_recs_future = executor.submit(
+        make_api_request,
+        "recommendations/skill-development",
+        params={"target_role": current_role, "career_goal": career_goal},
+        access_token=st.session_state.access_token
     )
+    career_paths = career_paths_future.result()
+    skill_recs = skill_recs_future.result()
 
 if "error" in career_paths:
     error_message = career_paths.get('error', '')
@@ -278,43 +450,9 @@ else:
                 if steps:
                     # Create a simple visual representation of the path
                     if len(steps) > 1:
-                        # Create a network graph of the career path
-                        G = nx.DiGraph()
-                        
-                        # Add nodes and edges
-                        for j, step in enumerate(steps):
-                            G.add_node(j, role=step.get("role", f"Role {j+1}"))
-                            if j > 0:
-                                G.add_edge(j-1, j)
-                        
-                        # Create plot
-                        plt.figure(figsize=(10, 4))
-                        pos = {i: (i, 0) for i in range(len(steps))}  # Position nodes in a line
-                        
-                        # Create custom colormap for nodes based on progression
-                        colors = LinearSegmentedColormap.from_list("career_progress", ["#4285F4", "#EA4335"])
-                        node_colors = [colors(j/(len(steps)-1)) for j in range(len(steps))]
-                        
-                        # Draw the graph
-                        nx.draw(
-                            G, 
-                            pos,
-                            with_labels=True,
-                            labels={j: data["role"] for j, data in G.nodes(data=True)},
-                            node_color=node_colors,
-                            node_size=2500,
-                            font_size=10,
-                            font_color="white",
-                            font_weight="bold",
-                            arrowsize=20,
-                            edge_color="#666666",
-                            width=2.0
-                        )
-                        
-                        # Save figure to buffer and display with st.pyplot
-                        buffer = plt.gcf()
-                        st.pyplot(buffer)
-                        plt.close()
+                        # Graph of the career path, laid out by Graphviz in the browser
+                        roles = [step.get("role", f"Role {j+1}") for j, step in enumerate(steps)]
+                        st.graphviz_chart(path_dot(roles), use_container_width=True)
                     
                     # Display details for each step
                     for j, step in enumerate(steps):
@@ -329,16 +467,12 @@ else:
                                 # Required skills for this step
                                 skills = step.get("skills", [])
                                 if skills:
-                                    st.markdown("**Key Skills Required:**")
-                                    for skill in skills:
-                                        st.markdown(f"- {skill}")
+                                    st.markdown("**Key Skills Required:**\n" + "\n".join(f"- {skill}" for skill in skills))
                                 
                                 # Responsibilities
                                 responsibilities = step.get("responsibilities", [])
                                 if responsibilities:
-                                    st.markdown("**Key Responsibilities:**")
-                                    for resp in responsibilities:
-                                        st.markdown(f"- {resp}")
+                                    st.markdown("**Key Responsibilities:**\n" + "\n".join(f"- {resp}" for resp in responsibilities))
                             
                             with col2:
                                 # Salary information
@@ -362,57 +496,28 @@ else:
                             # Growth opportunities
                             growth = step.get("growth_opportunities", [])
                             if growth:
-                                st.markdown("**Growth Opportunities:**")
-                                for opp in growth:
-                                    st.markdown(f"- {opp}")
+                                st.markdown("**Growth Opportunities:**\n" + "\n".join(f"- {opp}" for opp in growth))
                 
                 # Path comparison
                 if i == len(paths) - 1:  # On the last tab, show path comparison
                     st.subheader("Path Comparison")
                     
-                    # Create comparison dataframe
-                    comparison_data = []
-                    for p, path in enumerate(paths):
-                        comparison_data.append({
-                            "Path": path.get("name", f"Path {p+1}"),
-                            "Avg. Time (Years)": path.get("average_time_years", "N/A"),
-                            "Salary Growth": f"{path.get('salary_growth_percentage', 'N/A')}%",
-                            "Difficulty (1-10)": path.get("difficulty", "N/A"),
-                            "Steps": len(path.get("steps", [])),
-                            "End Role": path.get("steps", [])[-1].get("role", "N/A") if path.get("steps", []) else "N/A"
-                        })
-                    
                     # Display comparison table
-                    if comparison_data:
-                        st.dataframe(pd.DataFrame(comparison_data), hide_index=True)
+                    comparison_df = build_comparison(paths)
+                    if not comparison_df.empty:
+                        st.dataframe(comparison_df, hide_index=True)
 
 # Skills recommendation section
 st.subheader("Skills for Career Advancement")
 
-# Get skill recommendations
-skill_recs = make_api_request(
-    "recommendations/skill-development",
-    params={"target_role": current_role, "career_goal": career_goal}
-)
-
 if "error" not in skill_recs:
     skills = skill_recs.get("recommended_skills", [])
     if skills:
         st.write("Focus on developing these skills to advance in your career path:")
         
         # Display skills as a table with demand and growth trend
-        skill_data = []
-        for skill in skills:
-            skill_data.append({
-                "Skill": skill.get("name", ""),
-                "Demand Score": skill.get("demand_score", 0),
-                "Growth Trend": f"{skill.get('growth_trend', 0)}%",
-                "Category": skill.get("category", "Technical")
-            })
-        
-        # Create DataFrame and display
-        if skill_data:
-            df = pd.DataFrame(skill_data)
+        df = build_skill_table(skills)
+        if not df.empty:
             st.dataframe(
                 df.style.background_gradient(subset=['Demand Score'], cmap='YlGn'),
                 hide_index=True
@@ -425,30 +530,11 @@ else:
         # API endpoint doesn't exist yet, use mock data
         st.info("Skill development recommendations are currently being developed. Showing sample data for demonstration purposes.")
         
-        # Sample mock skills data
-        sample_skills = [
-            {"name": "System Architecture", "demand_score": 8, "growth_trend": 15, "category": "Technical"},
-            {"name": "Cloud Services (AWS/Azure)", "demand_score": 9, "growth_trend": 20, "category": "Technical"},
-            {"name": "CI/CD Pipelines", "demand_score": 7, "growth_trend": 12, "category": "DevOps"},
-            {"name": "Team Leadership", "demand_score": 8, "growth_trend": 10, "category": "Soft Skills"},
-            {"name": "Microservices", "demand_score": 8, "growth_trend": 18, "category": "Architecture"}
-        ]
-        
         st.write("Focus on developing these skills to advance in your career path:")
         
         # Display skills as a table with demand and growth trend
-        skill_data = []
-        for skill in sample_skills:
-            skill_data.append({
-                "Skill": skill.get("name", ""),
-                "Demand Score": skill.get("demand_score", 0),
-                "Growth Trend": f"{skill.get('growth_trend', 0)}%",
-                "Category": skill.get("category", "Technical")
-            })
-        
-        # Create DataFrame and display
-        if skill_data:
-            df = pd.DataFrame(skill_data)
+        df = build_skill_table(SAMPLE_SKILLS)
+        if not df.empty:
             st.dataframe(
                 df.style.background_gradient(subset=['Demand Score'], cmap='YlGn'),
                 hide_index=True
@@ -466,58 +552,38 @@ resource_tabs = st.tabs(categories)
 
 with resource_tabs[0]:  # Courses
     st.markdown("### Online Courses")
-    courses = [
-        {"title": "Leadership in Tech", "provider": "Coursera", "link": "https://coursera.org"},
-        {"title": "Advanced Cloud Architecture", "provider": "Udemy", "link": "https://udemy.com"},
-        {"title": "System Design for Senior Engineers", "provider": "edX", "link": "https://edx.org"}
-    ]
-    
-    for course in courses:
+    for title, provider, link in SAMPLE_COURSES:
         col1, col2 = st.columns([4, 1])
         with col1:
-            st.markdown(f"**{course['title']}**")
-            st.markdown(f"_{course['provider']}_")
+            st.markdown(f"**{title}**")
+            st.markdown(f"_{provider}_")
         with col2:
-            st.link_button("View", course["link"])
+            st.link_button("View", link)
         st.divider()
 
 with resource_tabs[1]:  # Books
     st.markdown("### Recommended Books")
-    books = [
-        {"title": "The Manager's Path", "author": "Camille Fournier"},
-        {"title": "Designing Data-Intensive Applications", "author": "Martin Kleppmann"},
-        {"title": "Staff Engineer: Leadership Beyond the Management Track", "author": "Will Larson"}
-    ]
-    
-    for book in books:
-        st.markdown(f"**{book['title']}** - {book['author']}")
+    st.markdown("\n".join(f"- **{title}** - {author}" for title, author in SAMPLE_BOOKS))
     
 with resource_tabs[2]:  # Communities
     st.markdown("### Professional Communities")
-    communities = [
-        {"name": "Tech Leadership Network", "type": "Online Forum"},
-        {"name": "Senior Engineers Hub", "type": "Slack Community"},
-        {"name": "Women in Tech Leadership", "type": "Networking Group"}
-    ]
-    
-    for community in communities:
-        st.markdown(f"**{community['name']}** ({community['type']})")
+    st.markdown("\n".join(f"- **{name}** ({kind})" for name, kind in SAMPLE_COMMUNITIES))
 
 with resource_tabs[3]:  # Certifications
     st.markdown("### Valuable Certifications")
-    certs = [
-        {"name": "AWS Solutions Architect", "org": "Amazon Web Services"},
-        {"name": "Google Cloud Professional Engineer", "org": "Google"},
-        {"name": "Project Management Professional (PMP)", "org": "PMI"}
-    ]
-    
-    for cert in certs:
-        st.markdown(f"**{cert['name']}** - {cert['org']}")
+    st.markdown("\n".join(f"- **{name}** - {org}" for name, org in SAMPLE_CERTIFICATIONS))
 
 # Feedback section
 st.subheader("Provide Feedback")
 st.write("Your feedback helps us improve career recommendations:")
 
+# Report a failed submission from an earlier run once it has finished
+pending_feedback = st.session_state.get("career_feedback_future")
+if pending_feedback is not None and pending_feedback.done():
+    del st.session_state.career_feedback_future
+    if "error" in pending_feedback.result():
+        st.error("Failed to submit feedback. Please try again later.")
+
 with st.form("career_feedback_form"):
     feedback_rating = st.slider("How helpful was this career path information?", 1, 5, 3)
     feedback_text = st.text_area("Additional feedback or suggestions:")
@@ -531,9 +597,13 @@ if submit_button:
         "feature": "career_paths"
     }
     
-    result = make_api_request("feedback", method="POST", data=feedback_data)
-    
-    if "error" not in result:
-        st.success("Thank you for your feedback!")
-    else:
-        st.error("Failed to submit feedback. Please try again later.") 
\ No newline at end of file
+    # Sent in the background so the page doesn't wait on the round-trip; the
+    # outcome is checked on a later run
+    st.session_state.career_feedback_future = get_feedback_executor().submit(
+        make_api_request,
+        "feedback",
+        method="POST",
+        data=feedback_data,
+        access_token=st.session_state.access_token
+    )
+    st.success("Thank you for your feedback!")
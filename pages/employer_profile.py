@@ -1,9 +1,8 @@
 import streamlit as st
 import requests
-import json
-import pandas as pd
+from requests.adapters import HTTPAdapter
 import re
-from datetime import datetime
+from urllib.parse import urlsplit
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
@@ -17,73 +16,200 @@ if st.session_state.user_type != "employer":
     st.warning("This page is only available for employers")
     st.stop()
 
+# Auth headers are normally built at login; rebuild them for sessions that predate that
+if "auth_headers" not in st.session_state:
+    st.session_state.auth_headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {st.session_state.access_token}"
+    }
+
+# Options for the profile selectboxes, in display order
+INDUSTRY_OPTIONS = (
+    "Technology", "Finance", "Healthcare", "Education", "EdTech", "E-commerce", 
+    "Manufacturing", "Retail", "Media", "Consulting", "Government",
+    "Non-profit", "Energy", "Transportation", "Hospitality", "Real Estate",
+    "Agriculture", "Entertainment", "Telecommunications", "Other"
+)
+COMPANY_SIZE_OPTIONS = ("1-10 employees", "11-50 employees", "51-200 employees", "201-500 employees", "501+ employees")
+REMOTE_POLICY_OPTIONS = ("Remote-first", "Hybrid", "In-office", "Flexible", "Varies by role")
+HIRING_TIMELINE_OPTIONS = ("Immediate", "Within 1 month", "1-3 months", "3+ months", "Ongoing")
+EDUCATION_LEVEL_OPTIONS = ("High School", "Associate's Degree", "Bachelor's Degree", "Master's Degree", "PhD", "No preference")
+NOTIFICATION_FREQUENCY_OPTIONS = ("Real-time", "Daily Digest", "Weekly Digest", "Never")
+PROFILE_VISIBILITY_OPTIONS = ("Public", "Registered Users Only", "Private")
+
+# Position of each option, so saved values map to a selectbox index without scanning
+INDUSTRY_INDEX = {option: i for i, option in enumerate(INDUSTRY_OPTIONS)}
+COMPANY_SIZE_INDEX = {option: i for i, option in enumerate(COMPANY_SIZE_OPTIONS)}
+REMOTE_POLICY_INDEX = {option: i for i, option in enumerate(REMOTE_POLICY_OPTIONS)}
+HIRING_TIMELINE_INDEX = {option: i for i, option in enumerate(HIRING_TIMELINE_OPTIONS)}
+NOTIFICATION_FREQUENCY_INDEX = {option: i for i, option in enumerate(NOTIFICATION_FREQUENCY_OPTIONS)}
+PROFILE_VISIBILITY_INDEX = {option: i for i, option in enumerate(PROFILE_VISIBILITY_OPTIONS)}
+
+# Inline logo placeholder, rendered without fetching an external image
+LOGO_PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="150" height="150" viewBox="0 0 150 150">'
+    '<rect width="150" height="150" fill="#cccccc"/>'
+    '<text x="75" y="82" font-family="sans-serif" font-size="20" fill="#969696" text-anchor="middle">Logo</text>'
+    '</svg>'
+)
+
+# Longest company description accepted into a profile update
+MAX_DESCRIPTION_LENGTH = 10000
+
+# Validation and parsing patterns, compiled once per page load
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+PHONE_PATTERN = re.compile(r"^(\+\d{1,3}[-\s]?)?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}$")
+CSV_SPLIT = re.compile(r"\s*,\s*")
+
 # Helper function for validation
+def parse_csv(text):
+    """Split a comma-separated input into a list of trimmed, non-empty values"""
+    return [item for item in CSV_SPLIT.split(text.strip()) if item]
+
+def collect_validation_errors(fields):
+    """Check (label, value, required, validator, saved value) field specs and return the error messages"""
+    errors = []
+    for label, value, required, validator, saved in fields:
+        if not value:
+            if required:
+                errors.append(f"{label} is required")
+        elif validator and value != saved and not validator(value):
+            errors.append(f"{label} is not valid")
+    return errors
+
 def validate_email(email):
     """Validate email format"""
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(EMAIL_PATTERN.match(email))
 
 def validate_url(url):
     """Validate URL format"""
-    pattern = r"^(https?:\/\/)?(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$"
-    return bool(re.match(pattern, url)) if url else True
+    if not url:
+        return True
+    # Check the parsed structure rather than a backtracking-prone regex
+    try:
+        parts = urlsplit(url if "://" in url else f"http://{url}")
+        hostname = parts.hostname or ""
+    except ValueError:
+        return False
+    return (
+        parts.scheme in ("http", "https")
+        and "." in hostname.strip(".")
+        and not any(c.isspace() for c in url)
+    )
 
 def validate_phone(phone):
     """Validate phone number format"""
-    pattern = r"^(\+\d{1,3}[-\s]?)?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}$"
-    return bool(re.match(pattern, phone)) if phone else True
+    return bool(PHONE_PATTERN.match(phone)) if phone else True
+
+# Shared HTTP session so backend calls reuse pooled keep-alive connections
+@st.cache_resource
+def get_api_session():
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 # Helper function
-def make_api_request(endpoint, method="GET", data=None, params=None):
-    """Make API request with proper headers and authentication"""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {st.session_state.access_token}"
-    }
+def make_api_request(endpoint, method="GET", data=None, params=None, parse_body=True):
+    """Make API request with proper headers and authentication.
     
+    Callers that only check for errors pass parse_body=False to skip decoding the response.
+    """
     url = f"{API_BASE_URL}/{endpoint}"
     
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
+        # The session is shared across users, so the token travels with each request
+        response = get_api_session().request(
+            method, url, headers=st.session_state.auth_headers, params=params, json=data, timeout=10
+        )
         
         if response.status_code in [200, 201, 204]:
-            return response.json() if response.content else {"message": "Success"}
+            if not parse_body or not response.content:
+                return {"message": "Success"}
+            return response.json()
         else:
             error_msg = response.json() if response.content else {"detail": "Unknown error"}
             return {"error": f"Status {response.status_code}", "detail": error_msg}
     except Exception as e:
         return {"error": str(e)}
 
+# Profile data, cached per access token so widget interactions don't refetch it.
+# Cleared after every successful update. Failures raise, so they are never cached.
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_profile_data(access_token):
+    response = get_api_session().get(
+        f"{API_BASE_URL}/profile",
+        headers={"Authorization": f"Bearer {access_token}"},
+        timeout=10
+    )
+    response.raise_for_status()
+    return response.json()
+
+def stage_profile_changes(changes):
+    """Merge one section's changes into the pending profile update"""
+    pending = st.session_state.pending_profile_patch
+    for key, value in changes.items():
+        if key == "company_details":
+            # Several sections update company details; merge rather than replace
+            company_details = {**pending.get("company_details", {}), **value}
+            if "social_media" in value and "social_media" in pending.get("company_details", {}):
+                company_details["social_media"] = {
+                    **pending["company_details"]["social_media"], **value["social_media"]
+                }
+            pending["company_details"] = company_details
+        else:
+            pending[key] = value
+
+def build_profile_update(pending, saved_company_details):
+    """Build the PUT body for the staged changes on top of the saved company details.
+    
+    The backend replaces company_details as a whole, so the saved fields
+    (and social links) are carried over for any section that wasn't edited.
+    """
+    update = dict(pending)
+    if "company_details" in pending:
+        staged = pending["company_details"]
+        company_details = {**saved_company_details, **staged}
+        if "social_media" in staged:
+            company_details["social_media"] = {
+                **(saved_company_details.get("social_media") or {}), **staged["social_media"]
+            }
+        update["company_details"] = company_details
+    return update
+
+# Profile changes staged by the section forms, sent together in one PUT
+if "pending_profile_patch" not in st.session_state:
+    st.session_state.pending_profile_patch = {}
+
 # Page title and description
 st.title("Company Profile")
 st.write("Complete your company profile to improve visibility and attract the right candidates.")
 
 # Get current profile data
 with st.spinner("Loading profile data..."):
-    profile_data = make_api_request("profile")
-
-if "error" in profile_data:
-    st.error(f"Failed to load profile: {profile_data.get('error')}")
-    st.stop()
+    try:
+        profile_data = fetch_profile_data(st.session_state.access_token)
+    except requests.HTTPError as e:
+        st.error(f"Failed to load profile: Status {e.response.status_code}")
+        st.stop()
+    except Exception as e:
+        st.error(f"Failed to load profile: {str(e)}")
+        st.stop()
 
-# Create tabs for different sections of the profile
-tabs = st.tabs(["Company Info", "Company Details", "Hiring Preferences", "Branding", "Settings"])
+# Nested sections read by several tabs, looked up once per run
+company_details = profile_data.get("company_details") or {}
+social_media = company_details.get("social_media") or {}
 
+# Each tab is a fragment, so submitting one tab's form only reruns that tab
 # Company Info Tab
-with tabs[0]:
+@st.fragment
+def company_info_tab(profile_data, company_details, social_media):
+    """Render the company information form and handle its submission"""
     with st.form("company_info_form"):
         st.subheader("Basic Company Information")
         
-        # Company details from profile
-        company_details = profile_data.get("company_details", {})
-        
         # Required fields
         company_name = st.text_input(
             "Company Name*", 
@@ -128,8 +254,6 @@ with tabs[0]:
             help="Your company's official website (e.g., https://example.com)"
         )
         
-        social_media = company_details.get("social_media", {})
-        
         linkedin = st.text_input(
             "LinkedIn Company Page", 
             value=social_media.get("linkedin", ""),
@@ -153,36 +277,19 @@ with tabs[0]:
     
     # Handle form submission
     if company_info_submit:
-        # Validation
-        validation_errors = []
-        
-        if not company_name:
-            validation_errors.append("Company Name is required")
-        
-        if not full_name:
-            validation_errors.append("Contact Person is required")
-        
-        if not position:
-            validation_errors.append("Position/Title is required")
-        
-        if not phone:
-            validation_errors.append("Phone Number is required")
-        elif not validate_phone(phone):
-            validation_errors.append("Phone Number format is invalid")
-        
-        if not website:
-            validation_errors.append("Company Website is required")
-        elif not validate_url(website):
-            validation_errors.append("Website URL is not valid")
-        
-        if linkedin and not validate_url(linkedin):
-            validation_errors.append("LinkedIn URL is not valid")
-        
-        if twitter and not validate_url(twitter):
-            validation_errors.append("Twitter/X URL is not valid")
-        
-        if facebook and not validate_url(facebook):
-            validation_errors.append("Facebook URL is not valid")
+        # Validation: (label, value, required, validator, saved value).
+        # Values unchanged from the saved profile were already validated, so only new ones are checked
+        fields = (
+            ("Company Name", company_name, True, None, None),
+            ("Contact Person", full_name, True, None, None),
+            ("Position/Title", position, True, None, None),
+            ("Phone Number", phone, True, validate_phone, None),
+            ("Company Website", website, True, validate_url, company_details.get("website", "")),
+            ("LinkedIn URL", linkedin, False, validate_url, social_media.get("linkedin", "")),
+            ("Twitter/X URL", twitter, False, validate_url, social_media.get("twitter", "")),
+            ("Facebook URL", facebook, False, validate_url, social_media.get("facebook", "")),
+        )
+        validation_errors = collect_validation_errors(fields)
         
         if validation_errors:
             for error in validation_errors:
@@ -204,53 +311,27 @@ with tabs[0]:
                 }
             }
             
-            # Send update request
-            with st.spinner("Updating company information..."):
-                result = make_api_request("profile", method="PUT", data=updated_profile)
-            
-            if "error" in result:
-                st.error(f"Failed to update company information: {result.get('error')}")
-                if "detail" in result:
-                    st.json(result.get("detail"))
-            else:
-                st.success("Company information updated successfully!")
-                st.balloons()
+            stage_profile_changes(updated_profile)
+            st.info("Company information changes staged. Click \"Save all changes\" in the sidebar to save them.")
 
 # Company Details Tab
-with tabs[1]:
+@st.fragment
+def company_details_tab(company_details):
+    """Render the company details form and handle its submission"""
     with st.form("company_details_form"):
-        company_details = profile_data.get("company_details", {})
-        
         st.subheader("Company Profile")
         
         # Industry and size
         industry = st.selectbox(
             "Industry*",
-            options=[
-                "Technology", "Finance", "Healthcare", "Education", "EdTech", "E-commerce", 
-                "Manufacturing", "Retail", "Media", "Consulting", "Government",
-                "Non-profit", "Energy", "Transportation", "Hospitality", "Real Estate",
-                "Agriculture", "Entertainment", "Telecommunications", "Other"
-            ],
-            index=0 if not company_details.get("industry") else 
-                  (lambda x: [
-                    "Technology", "Finance", "Healthcare", "Education", "EdTech", "E-commerce", 
-                    "Manufacturing", "Retail", "Media", "Consulting", "Government",
-                    "Non-profit", "Energy", "Transportation", "Hospitality", "Real Estate",
-                    "Agriculture", "Entertainment", "Telecommunications", "Other"
-                  ].index(x) if x in [
-                    "Technology", "Finance", "Healthcare", "Education", "EdTech", "E-commerce", 
-                    "Manufacturing", "Retail", "Media", "Consulting", "Government",
-                    "Non-profit", "Energy", "Transportation", "Hospitality", "Real Estate",
-                    "Agriculture", "Entertainment", "Telecommunications", "Other"
-                  ] else 0)(company_details.get("industry"))
+            options=INDUSTRY_OPTIONS,
+            index=INDUSTRY_INDEX.get(company_details.get("industry"), 0)
         )
         
         company_size = st.selectbox(
             "Company Size*",
-            options=["1-10 employees", "11-50 employees", "51-200 employees", "201-500 employees", "501+ employees"],
-            index=0 if not company_details.get("company_size") else 
-                  ["1-10 employees", "11-50 employees", "51-200 employees", "201-500 employees", "501+ employees"].index(company_details.get("company_size"))
+            options=COMPANY_SIZE_OPTIONS,
+            index=COMPANY_SIZE_INDEX.get(company_details.get("company_size"), 0)
         )
         
         # Convert founded_year to int if it's a string
@@ -261,6 +342,8 @@ with tabs[1]:
         except (ValueError, TypeError):
             founded_year_value = 2000
         
+        from datetime import datetime
+        
         founded_year = st.number_input(
             "Year Founded",
             min_value=1800,
@@ -329,19 +412,23 @@ with tabs[1]:
         if not location:
             validation_errors.append("Headquarters Location is required")
         
+        description_length = len(description)
         if not description:
             validation_errors.append("Company Description is required")
-        elif len(description) < 100:
+        elif description_length < 100:
             validation_errors.append("Company Description must be at least 100 characters")
+        elif description_length > MAX_DESCRIPTION_LENGTH:
+            # Refuse oversized pastes before they are staged for the profile update
+            validation_errors.append(f"Company Description must be at most {MAX_DESCRIPTION_LENGTH} characters")
         
         if validation_errors:
             for error in validation_errors:
                 st.error(error)
         else:
             # Parse comma-separated text fields into lists
-            values_list = [s.strip() for s in values_input.split(",") if s.strip()]
-            benefits_list = [s.strip() for s in benefits_input.split(",") if s.strip()]
-            additional_locations_list = [s.strip() for s in additional_locations.split(",") if s.strip()]
+            values_list = parse_csv(values_input)
+            benefits_list = parse_csv(benefits_input)
+            additional_locations_list = parse_csv(additional_locations)
             
             # Build updated company details
             updated_company_details = {
@@ -358,19 +445,13 @@ with tabs[1]:
                 }
             }
             
-            # Send update request
-            with st.spinner("Updating company details..."):
-                result = make_api_request("profile", method="PUT", data=updated_company_details)
-            
-            if "error" in result:
-                st.error(f"Failed to update company details: {result.get('error')}")
-                if "detail" in result:
-                    st.json(result.get("detail"))
-            else:
-                st.success("Company details updated successfully!")
+            stage_profile_changes(updated_company_details)
+            st.info("Company details changes staged. Click \"Save all changes\" in the sidebar to save them.")
 
 # Hiring Preferences Tab
-with tabs[2]:
+@st.fragment
+def hiring_preferences_tab(profile_data):
+    """Render the hiring preferences form and handle its submission"""
     with st.form("hiring_preferences_form"):
         st.subheader("Hiring Needs")
         
@@ -388,17 +469,15 @@ with tabs[2]:
         # Remote work policy
         remote_policy = st.selectbox(
             "Remote Work Policy",
-            options=["Remote-first", "Hybrid", "In-office", "Flexible", "Varies by role"],
-            index=0 if not profile_data.get("remote_policy") else 
-                 ["Remote-first", "Hybrid", "In-office", "Flexible", "Varies by role"].index(profile_data.get("remote_policy"))
+            options=REMOTE_POLICY_OPTIONS,
+            index=REMOTE_POLICY_INDEX.get(profile_data.get("remote_policy"), 0)
         )
         
         # Hiring timeline
         hiring_timeline = st.selectbox(
             "Hiring Timeline",
-            options=["Immediate", "Within 1 month", "1-3 months", "3+ months", "Ongoing"],
-            index=0 if not profile_data.get("hiring_timeline") else 
-                 ["Immediate", "Within 1 month", "1-3 months", "3+ months", "Ongoing"].index(profile_data.get("hiring_timeline"))
+            options=HIRING_TIMELINE_OPTIONS,
+            index=HIRING_TIMELINE_INDEX.get(profile_data.get("hiring_timeline"), 0)
         )
         
         # Skills preferences
@@ -431,7 +510,7 @@ with tabs[2]:
         
         education_level = st.multiselect(
             "Preferred Education Levels",
-            options=["High School", "Associate's Degree", "Bachelor's Degree", "Master's Degree", "PhD", "No preference"],
+            options=EDUCATION_LEVEL_OPTIONS,
             default=profile_data.get("education_level", ["No preference"]),
             help="Select all that apply for your typical positions"
         )
@@ -500,9 +579,9 @@ with tabs[2]:
                 st.error(error)
         else:
             # Parse comma-separated text fields into lists
-            roles_list = [s.strip() for s in roles_input.split(",") if s.strip()]
-            technical_skills_list = [s.strip() for s in technical_skills_input.split(",") if s.strip()]
-            soft_skills_list = [s.strip() for s in soft_skills_input.split(",") if s.strip()]
+            roles_list = parse_csv(roles_input)
+            technical_skills_list = parse_csv(technical_skills_input)
+            soft_skills_list = parse_csv(soft_skills_input)
             
             # Build updated preferences data
             updated_preferences = {
@@ -523,44 +602,13 @@ with tabs[2]:
                 }
             }
             
-            # Send update request
-            with st.spinner("Updating hiring preferences..."):
-                result = make_api_request("profile", method="PUT", data=updated_preferences)
-            
-            if "error" in result:
-                st.error(f"Failed to update hiring preferences: {result.get('error')}")
-                if "detail" in result:
-                    st.json(result.get("detail"))
-            else:
-                st.success("Hiring preferences updated successfully!")
-
-# Display notification about recommendation impacts
-st.info("""
-💡 **Tip:** Keeping your company profile up-to-date with accurate details and hiring preferences 
-helps the recommendation system find better candidate matches for your roles!
-""")
-
-# Company analytics section
-st.subheader("Company Profile Analytics")
-with st.expander("View Profile Performance"):
-    # This would typically be fetched from an analytics API endpoint
-    st.write("Profile visibility and engagement metrics:")
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Profile Views", "487", "+12%")
-    with col2:
-        st.metric("Candidate Applications", "64", "+8%")
-    with col3:
-        st.metric("Search Appearances", "1,243", "+21%")
-    
-    st.write("Complete your company profile to improve visibility to candidates.")
-    progress = 85  # This would be calculated based on profile completeness
-    st.progress(progress / 100)
-    st.write(f"Profile Completeness: {progress}%")
+            stage_profile_changes(updated_preferences)
+            st.info("Hiring preferences changes staged. Click \"Save all changes\" in the sidebar to save them.")
 
 # Branding Tab
-with tabs[3]:
+@st.fragment
+def branding_tab(company_details):
+    """Render the branding uploads and statements"""
     st.subheader("Company Branding")
     
     # Company logo
@@ -569,7 +617,7 @@ with tabs[3]:
     
     with logo_col1:
         # This would typically display the existing logo
-        st.image("https://via.placeholder.com/150x150.png?text=Logo", width=150)
+        st.image(LOGO_PLACEHOLDER_SVG, width=150)
     
     with logo_col2:
         with st.form("logo_upload_form"):
@@ -619,7 +667,7 @@ with tabs[3]:
     with st.form("video_form"):
         video_url = st.text_input(
             "YouTube or Vimeo URL",
-            value=profile_data.get("company_details", {}).get("video_url", ""),
+            value=company_details.get("video_url", ""),
             help="Enter a YouTube or Vimeo URL to showcase your company"
         )
         
@@ -629,15 +677,8 @@ with tabs[3]:
         if video_url:
             if validate_url(video_url):
                 # Handle video URL update
-                with st.spinner("Saving video URL..."):
-                    result = make_api_request("profile", method="PUT", data={
-                        "company_details": {"video_url": video_url}
-                    })
-                
-                if "error" in result:
-                    st.error(f"Failed to save video URL: {result.get('error')}")
-                else:
-                    st.success("Video URL saved successfully!")
+                stage_profile_changes({"company_details": {"video_url": video_url}})
+                st.info("Video URL staged. Click \"Save all changes\" in the sidebar to save it.")
             else:
                 st.error("Please enter a valid URL")
     
@@ -647,7 +688,7 @@ with tabs[3]:
     with st.form("branding_statement_form"):
         branding_statement = st.text_area(
             "Why Work With Us",
-            value=profile_data.get("company_details", {}).get("branding_statement", ""),
+            value=company_details.get("branding_statement", ""),
             help="Tell candidates why they should work at your company (max 500 characters)",
             height=150
         )
@@ -660,18 +701,13 @@ with tabs[3]:
                 st.error("Branding statement must be 500 characters or less")
             else:
                 # Handle branding statement update
-                with st.spinner("Saving branding statement..."):
-                    result = make_api_request("profile", method="PUT", data={
-                        "company_details": {"branding_statement": branding_statement}
-                    })
-                
-                if "error" in result:
-                    st.error(f"Failed to save branding statement: {result.get('error')}")
-                else:
-                    st.success("Branding statement saved successfully!")
+                stage_profile_changes({"company_details": {"branding_statement": branding_statement}})
+                st.info("Branding statement staged. Click \"Save all changes\" in the sidebar to save it.")
 
 # Settings Tab
-with tabs[4]:
+@st.fragment
+def settings_tab(profile_data):
+    """Render the account settings forms and the danger zone"""
     st.subheader("Account Settings")
     
     # Notification settings
@@ -704,9 +740,8 @@ with tabs[4]:
         # Notification frequency
         notification_frequency = st.selectbox(
             "Email Frequency",
-            options=["Real-time", "Daily Digest", "Weekly Digest", "Never"],
-            index=0 if not email_notifications.get("frequency") else 
-                 ["Real-time", "Daily Digest", "Weekly Digest", "Never"].index(email_notifications.get("frequency"))
+            options=NOTIFICATION_FREQUENCY_OPTIONS,
+            index=NOTIFICATION_FREQUENCY_INDEX.get(email_notifications.get("frequency"), 0)
         )
         
         notification_submit = st.form_submit_button("Save Notification Settings")
@@ -724,11 +759,12 @@ with tabs[4]:
         
         # Send update request
         with st.spinner("Updating notification settings..."):
-            result = make_api_request("profile/settings", method="PUT", data=updated_notifications)
+            result = make_api_request("profile/settings", method="PUT", data=updated_notifications, parse_body=False)
         
         if "error" in result:
             st.error(f"Failed to update notification settings: {result.get('error')}")
         else:
+            fetch_profile_data.clear()
             st.success("Notification settings updated successfully!")
     
     # Privacy settings
@@ -739,9 +775,8 @@ with tabs[4]:
         
         profile_visibility = st.selectbox(
             "Company Profile Visibility",
-            options=["Public", "Registered Users Only", "Private"],
-            index=0 if not privacy_settings.get("profile_visibility") else 
-                 ["Public", "Registered Users Only", "Private"].index(privacy_settings.get("profile_visibility"))
+            options=PROFILE_VISIBILITY_OPTIONS,
+            index=PROFILE_VISIBILITY_INDEX.get(privacy_settings.get("profile_visibility"), 0)
         )
         
         show_company_stats = st.checkbox(
@@ -770,11 +805,12 @@ with tabs[4]:
         
         # Send update request
         with st.spinner("Updating privacy settings..."):
-            result = make_api_request("profile/privacy", method="PUT", data=updated_privacy)
+            result = make_api_request("profile/privacy", method="PUT", data=updated_privacy, parse_body=False)
         
         if "error" in result:
             st.error(f"Failed to update privacy settings: {result.get('error')}")
         else:
+            fetch_profile_data.clear()
             st.success("Privacy settings updated successfully!")
     
     # Change password
@@ -813,7 +849,7 @@ with tabs[4]:
             }
             
             with st.spinner("Changing password..."):
-                result = make_api_request("auth/change-password", method="POST", data=password_data)
+                result = make_api_request("auth/change-password", method="POST", data=password_data, parse_body=False)
             
             if "error" in result:
                 st.error(f"Failed to change password: {result.get('error')}")
@@ -840,13 +876,13 @@ with tabs[4]:
             else:
                 # Send delete request
                 with st.spinner("Deleting account..."):
-                    result = make_api_request("profile", method="DELETE")
+                    result = make_api_request("profile", method="DELETE", parse_body=False)
                 
                 if "error" in result:
                     st.error(f"Failed to delete account: {result.get('error')}")
                 else:
                     # Clear session state
-                    for key in ["authenticated", "user_type", "access_token"]:
+                    for key in ["authenticated", "user_type", "access_token", "auth_headers", "pending_profile_patch"]:
                         if key in st.session_state:
                             del st.session_state[key]
                     
@@ -854,6 +890,76 @@ with tabs[4]:
                     st.info("You will be redirected to the login page in a few seconds...")
                     st.experimental_rerun()
 
+# Create tabs for different sections of the profile
+tabs = st.tabs(["Company Info", "Company Details", "Hiring Preferences", "Branding", "Settings"])
+
+with tabs[0]:
+    company_info_tab(profile_data, company_details, social_media)
+
+with tabs[1]:
+    company_details_tab(company_details)
+
+with tabs[2]:
+    hiring_preferences_tab(profile_data)
+
+with tabs[3]:
+    branding_tab(company_details)
+
+with tabs[4]:
+    settings_tab(profile_data)
+
+# Display notification about recommendation impacts
+st.info("""
+💡 **Tip:** Keeping your company profile up-to-date with accurate details and hiring preferences 
+helps the recommendation system find better candidate matches for your roles!
+""")
+
+# Company analytics section
+st.subheader("Company Profile Analytics")
+with st.expander("View Profile Performance"):
+    # This would typically be fetched from an analytics API endpoint
+    st.write("Profile visibility and engagement metrics:")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Profile Views", "487", "+12%")
+    with col2:
+        st.metric("Candidate Applications", "64", "+8%")
+    with col3:
+        st.metric("Search Appearances", "1,243", "+21%")
+    
+    st.write("Complete your company profile to improve visibility to candidates.")
+    progress = 85  # This would be calculated based on profile completeness
+    st.progress(progress / 100)
+    st.write(f"Profile Completeness: {progress}%")
+
+# Save all staged profile changes with a single request
+with st.sidebar:
+    if st.session_state.pending_profile_patch:
+        st.caption("You have unsaved profile changes.")
+    
+    if st.button("Save all changes"):
+        if not st.session_state.pending_profile_patch:
+            st.info("No changes to save.")
+        else:
+            with st.spinner("Saving profile changes..."):
+                result = make_api_request(
+                    "profile",
+                    method="PUT",
+                    data=build_profile_update(st.session_state.pending_profile_patch, company_details),
+                    parse_body=False
+                )
+            
+            if "error" in result:
+                st.error(f"Failed to update profile: {result.get('error')}")
+                if "detail" in result:
+                    st.json(result.get("detail"))
+            else:
+                st.session_state.pending_profile_patch = {}
+                fetch_profile_data.clear()
+                st.success("Profile updated successfully!")
+                st.balloons()
+
 # Add help box at the bottom
 st.info("""
 💡 **Tip:** Complete your company profile to improve visibility to potential candidates.
@@ -1,11 +1,19 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import json
 import pandas as pd
 from datetime import datetime
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+# Columns shown in the recommendations table, after flattening nested fields
+JOB_TABLE_COLUMNS = (
+    "title", "company", "location", "match_score",
+    "salary_range.min", "salary_range.max", "required_experience", "status"
+)
 
 # Check authentication
 if "authenticated" not in st.session_state or not st.session_state.authenticated:
@@ -26,32 +34,71 @@ if "job_filters" not in st.session_state:
         "min_match_score": 50
     }
 
-# Helper function
-def make_api_request(endpoint, method="GET", data=None, params=None):
-    """Make API request with proper headers and authentication"""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {st.session_state.access_token}"
-    }
-    
-    url = f"{API_BASE_URL}/{endpoint}"
-    
+# Shared HTTP session so backend calls, including the concurrent ones, reuse
+# pooled keep-alive connections
+@st.cache_resource
+def get_api_session():
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Recommendations are cached per filter params and token, since the page reruns on
+# every widget change. Params come in as a sorted tuple of items so they hash.
+# Failures raise, so they are never cached.
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_job_recommendations(params, access_token):
+    response = get_api_session().get(
+        f"{API_BASE_URL}/recommendations/jobs",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params=dict(params),
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+def get_job_recommendations(params, access_token):
+    """Fetch job recommendations through the cache, returning an error dict on failure"""
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        
-        if response.status_code in [200, 201, 204]:
-            return response.json() if response.content else {"message": "Success"}
-        else:
-            error_msg = response.json() if response.content else {"detail": "Unknown error"}
-            return {"error": f"Status {response.status_code}", "detail": error_msg}
+        return fetch_job_recommendations(tuple(sorted(params.items())), access_token)
+    except requests.HTTPError as e:
+        error_msg = e.response.json() if e.response.content else {"detail": "Unknown error"}
+        return {"error": f"Status {e.response.status_code}", "detail": error_msg}
     except Exception as e:
         return {"error": str(e)}
 
+# Saved and applied job lists, cached per token so row clicks and paging don't refetch
+# them. Kept short-lived since they change as the candidate saves and applies.
+# Failures raise, so they are never cached.
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_saved_jobs(access_token):
+    response = get_api_session().get(
+        f"{API_BASE_URL}/saved-jobs",
+        headers={"Authorization": f"Bearer {access_token}"},
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_applications(access_token):
+    response = get_api_session().get(
+        f"{API_BASE_URL}/applications",
+        headers={"Authorization": f"Bearer {access_token}"},
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+def get_status_job_ids(fetch, access_token):
+    """Return the job ids from a cached status list; they only add badges, so failures give an empty set"""
+    try:
+        return {str(item.get("job_id")) for item in fetch(access_token)}
+    except Exception:
+        return set()
+
 def validate_application(cover_letter, resume):
     """Validate job application inputs"""
     if not cover_letter.strip():
@@ -169,99 +216,149 @@ if filters["experience_level"]:
 if filters["min_match_score"]:
     params["min_match_score"] = filters["min_match_score"]
 
-# Get job recommendations
-with st.spinner("Loading job recommendations..."):
-    try:
-        job_recs = make_api_request("recommendations/jobs", params=params)
+# Results are a fragment, so paging and the per-job buttons only rerun this block
+@st.fragment
+def recommendations_fragment(params, recommendation_count):
+    """Fetch and render the job recommendations for the given filter params"""
+    with st.spinner("Loading job recommendations..."):
+        try:
+            # The recommendations and the saved/applied status lists are independent,
+            # so fetch them concurrently
+            access_token = st.session_state.access_token
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                recs_future = executor.submit(get_job_recommendations, params, access_token)
+                saved_future = executor.submit(get_status_job_ids, fetch_saved_jobs, access_token)
+                applied_future = executor.submit(get_status_job_ids, fetch_applications, access_token)
+                job_recs = recs_future.result()
+                saved_job_ids = saved_future.result()
+                applied_job_ids = applied_future.result()
 
-        if "error" in job_recs:
-            st.error(f"Failed to load job recommendations: {job_recs.get('error')}")
-            if st.button("Retry"):
-                st.rerun()
-        else:
-            # Handle both list and dictionary responses from the API
-            if isinstance(job_recs, list):
-                jobs = job_recs
-                total_count = len(jobs)
+            if "error" in job_recs:
+                st.error(f"Failed to load job recommendations: {job_recs.get('error')}")
+                if st.button("Retry"):
+                    st.rerun()
             else:
-                jobs = job_recs.get("items", [])
-                total_count = job_recs.get("total_count", 0)
+                # Handle both list and dictionary responses from the API
+                if isinstance(job_recs, list):
+                    jobs = job_recs
+                    total_count = len(jobs)
+                else:
+                    jobs = job_recs.get("items", [])
+                    total_count = job_recs.get("total_count", 0)
             
-            # Show recommendation stats
-            st.write(f"Found {total_count} matching job recommendations")
+                # Show recommendation stats
+                st.write(f"Found {total_count} matching job recommendations")
             
-            if not jobs:
-                st.info("""
-                No job recommendations found with the current filters. Try:
-                - Lowering the minimum match score
-                - Removing some filters
-                - Updating your profile with more skills
-                """)
+                if not jobs:
+                    st.info("""
+                    No job recommendations found with the current filters. Try:
+                    - Lowering the minimum match score
+                    - Removing some filters
+                    - Updating your profile with more skills
+                    """)
             
-            # Display job recommendations
-            for idx, job in enumerate(jobs):
-                with st.container():
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(f"### {job.get('title', 'Untitled Position')}")
-                        st.write(f"**Company:** {job.get('company', 'N/A')}")
-                        st.write(f"**Location:** {job.get('location', 'N/A')}")
-                        st.write(f"**Match Score:** {job.get('match_score', 'N/A')}%")
-                        
-                        # Display skills match
-                        skills_match = job.get('skills_match', [])
-                        if skills_match:
-                            st.write("**Matching Skills:**")
-                            st.write(", ".join(skills_match))
-                        
-                        # Display description preview
-                        description = job.get('description', '')
-                        if description:
-                            st.write("**Description Preview:**")
-                            preview = description[:200] + "..." if len(description) > 200 else description
-                            st.write(preview)
+                # Display job recommendations as one table; the detail card is only
+                # rendered for the row the user selects
+                if jobs:
+                    job_df = pd.json_normalize(jobs)
+                    job_df["status"] = [
+                        "Applied" if str(job.get("id")) in applied_job_ids
+                        else "Saved" if str(job.get("id")) in saved_job_ids
+                        else ""
+                        for job in jobs
+                    ]
+                    table_columns = [column for column in JOB_TABLE_COLUMNS if column in job_df.columns]
+                    job_table = st.dataframe(
+                        job_df[table_columns],
+                        column_config={
+                            "title": st.column_config.TextColumn("Position"),
+                            "company": st.column_config.TextColumn("Company"),
+                            "location": st.column_config.TextColumn("Location"),
+                            "match_score": st.column_config.ProgressColumn(
+                                "Match Score", min_value=0, max_value=100, format="%d%%"
+                            ),
+                            "salary_range.min": st.column_config.NumberColumn("Salary From", format="$%d"),
+                            "salary_range.max": st.column_config.NumberColumn("Salary To", format="$%d"),
+                            "required_experience": st.column_config.NumberColumn("Experience (years)"),
+                            "status": st.column_config.TextColumn("Status")
+                        },
+                        use_container_width=True,
+                        hide_index=True,
+                        on_select="rerun",
+                        selection_mode="single-row",
+                        key="job_table"
+                    )
                     
+                    selected_rows = job_table.selection.rows
+                    if selected_rows:
+                        idx = selected_rows[0]
+                        job = jobs[idx]
+                        with st.expander(job.get('title', 'Untitled Position'), expanded=True):
+                            col1, col2 = st.columns([3, 1])
+                            with col1:
+                                st.write(f"**Company:** {job.get('company', 'N/A')}")
+                                st.write(f"**Location:** {job.get('location', 'N/A')}")
+                                st.write(f"**Match Score:** {job.get('match_score', 'N/A')}%")
+                                
+                                # Display skills match
+                                skills_match = job.get('skills_match', [])
+                                if skills_match:
+                                    st.write("**Matching Skills:**")
+                                    st.write(", ".join(skills_match))
+                                
+                                # Display description preview
+                                description = job.get('description', '')
+                                if description:
+                                    st.write("**Description Preview:**")
+                                    preview = description[:200] + "..." if len(description) > 200 else description
+                                    st.write(preview)
+                            
+                            with col2:
+                                # Use index as fallback for unique keys
+                                job_id = job.get('id')
+                                view_key = f"view_{job_id if job_id is not None else f'idx_{idx}'}"
+                                apply_key = f"apply_{job_id if job_id is not None else f'idx_{idx}'}"
+                                save_key = f"save_{job_id if job_id is not None else f'idx_{idx}'}"
+                                
+                                st.button("View Details", key=view_key)
+                                st.button("Apply Now", key=apply_key)
+                                st.button("Save Job", key=save_key)
+                                
+                                if str(job_id) in applied_job_ids:
+                                    st.caption("✓ Applied")
+                                if str(job_id) in saved_job_ids:
+                                    st.caption("✓ Saved")
+                            
+                            # Add metrics if available
+                            if job.get('salary_range'):
+                                salary = job['salary_range']
+                                st.write(f"**Salary Range:** ${salary.get('min', 'N/A')} - ${salary.get('max', 'N/A')}")
+                            
+                            if job.get('required_experience'):
+                                st.write(f"**Required Experience:** {job['required_experience']} years")
+
+                # Pagination with validation
+                if total_count > recommendation_count:
+                    col1, col2, col3 = st.columns([1, 3, 1])
                     with col2:
-                        # Use index as fallback for unique keys
-                        job_id = job.get('id')
-                        view_key = f"view_{job_id if job_id is not None else f'idx_{idx}'}"
-                        apply_key = f"apply_{job_id if job_id is not None else f'idx_{idx}'}"
-                        save_key = f"save_{job_id if job_id is not None else f'idx_{idx}'}"
-                        
-                        st.button("View Details", key=view_key)
-                        st.button("Apply Now", key=apply_key)
-                        st.button("Save Job", key=save_key)
-                    
-                    # Add metrics if available
-                    if job.get('salary_range'):
-                        salary = job['salary_range']
-                        st.write(f"**Salary Range:** ${salary.get('min', 'N/A')} - ${salary.get('max', 'N/A')}")
-                    
-                    if job.get('required_experience'):
-                        st.write(f"**Required Experience:** {job['required_experience']} years")
-                    
-                    st.divider()
+                        page_count = (total_count + recommendation_count - 1) // recommendation_count
+                        current_page = st.session_state.get("current_page", 1)
+                        pages = st.select_slider(
+                            "Page",
+                            options=list(range(1, page_count + 1)),
+                            value=current_page,
+                            help=f"Page {current_page} of {page_count}"
+                        )
+                        if pages != current_page:
+                            st.session_state.current_page = pages
+                            st.rerun(scope="fragment")
 
-            # Pagination with validation
-            if total_count > recommendation_count:
-                col1, col2, col3 = st.columns([1, 3, 1])
-                with col2:
-                    page_count = (total_count + recommendation_count - 1) // recommendation_count
-                    current_page = st.session_state.get("current_page", 1)
-                    pages = st.select_slider(
-                        "Page",
-                        options=list(range(1, page_count + 1)),
-                        value=current_page,
-                        help=f"Page {current_page} of {page_count}"
-                    )
-                    if pages != current_page:
-                        st.session_state.current_page = pages
-                        st.rerun()
+        except Exception as e:
+            st.error(f"An error occurred while loading recommendations: {str(e)}")
+            if st.button("Retry"):
+                st.rerun()
 
-    except Exception as e:
-        st.error(f"An error occurred while loading recommendations: {str(e)}")
-        if st.button("Retry"):
-            st.rerun()
+recommendations_fragment(params, recommendation_count)
 
 # Job application modal with validation
 if "show_application_modal" in st.session_state and st.session_state.show_application_modal:
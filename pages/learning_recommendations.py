@@ -1,33 +1,56 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import json
+from collections import defaultdict
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+# Days covered by each learning timeframe, split across the path's phases
+TIMEFRAME_DAYS = {
+    "3_months": 90,
+    "6_months": 180,
+    "1_year": 365,
+    "2_years": 730,
+    "5_years": 1825
+}
 
 # Check authentication
 if "authenticated" not in st.session_state or not st.session_state.authenticated:
     st.warning("Please login to access this page")
     st.stop()
 
-# Helper function
-def make_api_request(endpoint, method="GET", data=None, params=None):
-    """Make API request with proper headers and authentication"""
-    headers = {
+# Auth headers are normally built at login; rebuild them for sessions that predate that
+if "auth_headers" not in st.session_state:
+    st.session_state.auth_headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {st.session_state.access_token}"
     }
-    
+
+# Shared HTTP session so backend calls reuse pooled keep-alive connections
+@st.cache_resource
+def get_api_session():
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Helper function
+def make_api_request(endpoint, method="GET", data=None, params=None):
+    """Make API request with proper headers and authentication"""
     url = f"{API_BASE_URL}/{endpoint}"
     
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
+        response = get_api_session().request(
+            method, url, headers=st.session_state.auth_headers, params=params, json=data, timeout=REQUEST_TIMEOUT
+        )
         
         if response.status_code in [200, 201, 204]:
             return response.json() if response.content else {"message": "Success"}
@@ -37,6 +60,81 @@ def make_api_request(endpoint, method="GET", data=None, params=None):
     except Exception as e:
         return {"error": str(e)}
 
+# Recommendations are cached per goal, timeframe, skills and token, so toggling the
+# display checkboxes doesn't regenerate them. Failures raise, so they are never cached.
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_learning_recommendations(career_goal, timeframe, skills, access_token):
+    params = {"career_goal": career_goal, "timeframe": timeframe}
+    if skills:
+        params["skills"] = json.dumps(list(skills))
+    response = get_api_session().get(
+        f"{API_BASE_URL}/ml/learning-recommendations",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params=params,
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+# Resources are a fragment, so toggling the display options only reruns this list
+@st.fragment
+def resources_fragment(resources):
+    """Render the recommended resources grouped by type, with display toggles"""
+    st.subheader("Recommended Learning Resources")
+    
+    # Display preferences
+    pref_col1, pref_col2, pref_col3 = st.columns(3)
+    with pref_col1:
+        show_difficulty = st.checkbox("Show Difficulty Levels", value=True)
+    with pref_col2:
+        show_prerequisites = st.checkbox("Show Prerequisites", value=True)
+    with pref_col3:
+        show_time_commitment = st.checkbox("Show Time Commitment", value=True)
+    
+    # Group resources by type
+    resource_types = defaultdict(list)
+    for resource in resources:
+        resource_types[resource.get("type", "Other")].append(resource)
+    
+    # Create tabs for each resource type
+    tabs = st.tabs(list(resource_types.keys()))
+    
+    for i, (res_type, res_list) in enumerate(resource_types.items()):
+        with tabs[i]:
+            for j, resource in enumerate(res_list):
+                with st.container():
+                    col1, col2 = st.columns([3, 1])
+                    
+                    with col1:
+                        title = resource.get("title", "Untitled Resource")
+                        url = resource.get("url", "#")
+                        st.markdown(f"### [{title}]({url})")
+                        
+                        if resource.get("description"):
+                            st.write(resource.get("description"))
+                        
+                        # Show tags if available
+                        if resource.get("tags"):
+                            tags = resource.get("tags", [])
+                            st.write(" ".join([f"`{tag}`" for tag in tags]))
+                    
+                    with col2:
+                        # Display metrics based on preferences
+                        if show_difficulty and "difficulty" in resource:
+                            difficulty = resource.get("difficulty", "Medium")
+                            st.metric("Difficulty", difficulty)
+                        
+                        if show_time_commitment and "time_commitment" in resource:
+                            time_commitment = resource.get("time_commitment", "Unknown")
+                            st.metric("Time", time_commitment)
+                    
+                    # Show prerequisites if enabled and available
+                    if show_prerequisites and resource.get("prerequisites"):
+                        st.write("**Prerequisites:**")
+                        st.write(", ".join(resource.get("prerequisites", [])))
+                    
+                    st.divider()
+
 # Page title
 st.title("Learning Recommendations")
 st.write("""
@@ -102,27 +200,21 @@ with st.sidebar:
         placeholder="Enter your skills, separated by commas",
         help="List your current skills to get more tailored recommendations"
     )
-    
-    # Display preferences
-    st.subheader("Display Preferences")
-    show_difficulty = st.checkbox("Show Difficulty Levels", value=True)
-    show_prerequisites = st.checkbox("Show Prerequisites", value=True)
-    show_time_commitment = st.checkbox("Show Time Commitment", value=True)
 
-# Prepare parameters
-params = {
-    "career_goal": career_goal,
-    "timeframe": timeframe
-}
-
-if current_skills:
-    skills_list = [skill.strip() for skill in current_skills.split(",") if skill.strip()]
-    if skills_list:
-        params["skills"] = json.dumps(skills_list)
+# Skills as a tuple so they can key the recommendations cache
+skills = tuple(skill.strip() for skill in current_skills.split(",") if skill.strip())
 
 # Get learning recommendations
 with st.spinner("Generating learning recommendations..."):
-    learning_data = make_api_request("ml/learning-recommendations", params=params)
+    try:
+        learning_data = fetch_learning_recommendations(
+            career_goal, timeframe, skills, st.session_state.access_token
+        )
+    except requests.HTTPError as e:
+        error_msg = e.response.json() if e.response.content else {"detail": "Unknown error"}
+        learning_data = {"error": f"Status {e.response.status_code}", "detail": error_msg}
+    except Exception as e:
+        learning_data = {"error": str(e)}
     
     if "error" in learning_data:
         st.error(f"Failed to get learning recommendations: {learning_data.get('error')}")
@@ -158,39 +250,24 @@ with st.spinner("Generating learning recommendations..."):
             phases = learning_path.get("phases", [])
             
             if phases:
-                # Create a Gantt chart for phases
-                phase_data = []
-                start_date = pd.Timestamp.now()
-                
-                for i, phase in enumerate(phases):
-                    # Calculate duration based on timeframe and phase weight
-                    total_days = {
-                        "3_months": 90,
-                        "6_months": 180,
-                        "1_year": 365,
-                        "2_years": 730,
-                        "5_years": 1825
-                    }.get(timeframe, 180)
-                    
-                    phase_weight = phase.get("weight", 1)
-                    phase_duration = int(total_days * phase_weight / sum(p.get("weight", 1) for p in phases))
-                    
-                    end_date = start_date + pd.Timedelta(days=phase_duration)
-                    
-                    phase_data.append({
-                        "Task": phase.get("name", f"Phase {i+1}"),
-                        "Description": phase.get("description", ""),
-                        "Start": start_date,
-                        "Finish": end_date,
-                        "Duration": phase_duration,
-                        "Priority": phase.get("priority", "Medium")
-                    })
-                    
-                    # Update start date for next phase
-                    start_date = end_date
+                # Create a Gantt chart for phases. Each phase gets a share of the
+                # timeframe proportional to its weight, laid end to end from today.
+                weights = np.fromiter((phase.get("weight", 1) for phase in phases), dtype=float, count=len(phases))
+                if weights.sum() <= 0:
+                    # No usable weights; split the timeframe evenly
+                    weights = np.ones(len(phases))
+                durations = (TIMEFRAME_DAYS.get(timeframe, 180) * weights / weights.sum()).astype(np.int64)
+                finishes = pd.Timestamp.now() + pd.to_timedelta(durations.cumsum(), unit="D")
                 
                 # Create DataFrame
-                df = pd.DataFrame(phase_data)
+                df = pd.DataFrame({
+                    "Task": [phase.get("name", f"Phase {i+1}") for i, phase in enumerate(phases)],
+                    "Description": [phase.get("description", "") for phase in phases],
+                    "Start": finishes - pd.to_timedelta(durations, unit="D"),
+                    "Finish": finishes,
+                    "Duration": durations,
+                    "Priority": [phase.get("priority", "Medium") for phase in phases]
+                })
                 
                 # Create Gantt chart
                 fig = px.timeline(
@@ -233,54 +310,7 @@ with st.spinner("Generating learning recommendations..."):
         
         # Display learning resources
         if resources:
-            st.subheader("Recommended Learning Resources")
-            
-            # Group resources by type
-            resource_types = {}
-            for resource in resources:
-                res_type = resource.get("type", "Other")
-                if res_type not in resource_types:
-                    resource_types[res_type] = []
-                resource_types[res_type].append(resource)
-            
-            # Create tabs for each resource type
-            tabs = st.tabs(list(resource_types.keys()))
-            
-            for i, (res_type, res_list) in enumerate(resource_types.items()):
-                with tabs[i]:
-                    for j, resource in enumerate(res_list):
-                        with st.container():
-                            col1, col2 = st.columns([3, 1])
-                            
-                            with col1:
-                                title = resource.get("title", "Untitled Resource")
-                                url = resource.get("url", "#")
-                                st.markdown(f"### [{title}]({url})")
-                                
-                                if resource.get("description"):
-                                    st.write(resource.get("description"))
-                                
-                                # Show tags if available
-                                if resource.get("tags"):
-                                    tags = resource.get("tags", [])
-                                    st.write(" ".join([f"`{tag}`" for tag in tags]))
-                            
-                            with col2:
-                                # Display metrics based on preferences
-                                if show_difficulty and "difficulty" in resource:
-                                    difficulty = resource.get("difficulty", "Medium")
-                                    st.metric("Difficulty", difficulty)
-                                
-                                if show_time_commitment and "time_commitment" in resource:
-                                    time_commitment = resource.get("time_commitment", "Unknown")
-                                    st.metric("Time", time_commitment)
-                            
-                            # Show prerequisites if enabled and available
-                            if show_prerequisites and resource.get("prerequisites"):
-                                st.write("**Prerequisites:**")
-                                st.write(", ".join(resource.get("prerequisites", [])))
-                            
-                            st.divider()
+            resources_fragment(resources)
         else:
             st.info("No learning resources found for the selected criteria.")
 
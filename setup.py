@@ -846,7 +846,7 @@ def install_dependencies():
         # Install other utilities
         print("Installing utility packages...")
         result = run_command([
-            PIP_EXEC, "install", "requests>=2.28.2", "numpy>=1.24.2", 
+            PIP_EXEC, "install", "requests>=2.28.2", "orjson>=3.8.0", "numpy>=1.24.2", 
             "python-multipart>=0.0.6", "pydantic>=2.0.0", "email-validator>=2.0.0"
         ])
         if result.returncode != 0:
@@ -97,6 +97,11 @@ def login(email, password):
         if response.status_code == 200:
             token_data = response.json()
             st.session_state.access_token = token_data.get("access_token")
+            # Built once per login so pages can reuse it for every backend call
+            st.session_state.auth_headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {st.session_state.access_token}"
+            }
             st.session_state.authenticated = True
             
             # Get user profile to determine user type
@@ -53,6 +53,60 @@ except ImportError:
 FRONTEND_URL = "http://localhost:8501"
 BACKEND_URL = "http://localhost:8000"
 WAIT_TIME = 10  # seconds
+DRIVER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "job_recommender", "chromedriver_path")
+
+# Login locators, built once and shared by every login() call
+LOGIN_TABS_LOCATOR = (By.CSS_SELECTOR, ".stTabs [role='tab']")
+LOGIN_EMAIL_LOCATOR = (By.CSS_SELECTOR, "input[aria-label='login_email']")
+LOGIN_PASSWORD_LOCATOR = (By.CSS_SELECTOR, "input[aria-label='login_password']")
+LOGIN_BUTTON_LOCATOR = (By.XPATH, "//button[text()='Login']")
+LOGIN_SUCCESS_CONDITION = EC.any_of(
+    EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Login successful')]")),
+    EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Logout')]"))
+)
+LOGIN_ERROR_LOCATOR = (By.CSS_SELECTOR, "div[class*='stAlert']")
+
+# Finds the login tab, fills in the credentials and submits the form in a single
+# round trip. Streamlit inputs are React-controlled, so values are written through
+# the native setter and committed with input/blur events like a real user would.
+LOGIN_JS_BUNDLE = """
+const [email, password] = arguments;
+const tabs = document.querySelectorAll(".stTabs [role='tab']");
+if (!tabs.length) return {ok: false, reason: "login tab not found"};
+tabs[0].click();
+
+const emailInput = document.querySelector("input[aria-label='login_email']");
+const passwordInput = document.querySelector("input[aria-label='login_password']");
+if (!emailInput || !passwordInput) return {ok: false, reason: "login fields not found"};
+
+const setValue = (input, value) => {
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+    input.focus();
+    setter.call(input, value);
+    input.dispatchEvent(new Event("input", {bubbles: true}));
+    input.blur();
+};
+setValue(emailInput, email);
+setValue(passwordInput, password);
+
+const button = Array.from(document.querySelectorAll("button"))
+    .find(b => b.textContent.trim() === "Login");
+if (!button) return {ok: false, reason: "login button not found"};
+button.click();
+return {ok: true};
+"""
+
+# Sets a single input's value in one round trip instead of one per keystroke
+FILL_INPUT_JS = """
+const [input, value] = arguments;
+const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(input), "value").set;
+input.focus();
+setter.call(input, value);
+input.dispatchEvent(new Event("input", {bubbles: true}));
+input.dispatchEvent(new Event("change", {bubbles: true}));
+input.blur();
+return input.value === value;
+"""
 
 # Process tracking
 processes = []
@@ -88,6 +142,16 @@ def highlight_element(driver, element, duration=1):
         original_style
     )
 
+def fill_input(driver, element, value):
+    """Set an input's value via JavaScript, falling back to typing it key by key"""
+    try:
+        if driver.execute_script(FILL_INPUT_JS, element, value):
+            return
+    except Exception:
+        pass
+    element.clear()
+    element.send_keys(value)
+
 def start_services():
     """Start the backend and frontend services if they're not already running"""
     try:
@@ -147,17 +211,50 @@ def cleanup():
         except:
             pass
 
-def init_driver():
+def get_chromedriver_path(refresh=False):
+    """Return the ChromeDriver path, only asking ChromeDriverManager when it isn't cached yet"""
+    if not refresh:
+        try:
+            with open(DRIVER_PATH_CACHE) as f:
+                cached_path = f.read().strip()
+            if os.path.isfile(cached_path):
+                return cached_path
+        except OSError:
+            pass
+    
+    driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(DRIVER_PATH_CACHE), exist_ok=True)
+        with open(DRIVER_PATH_CACHE, "w") as f:
+            f.write(driver_path)
+    except OSError as e:
+        print(f"⚠️ Could not cache ChromeDriver path: {e}")
+    return driver_path
+
+def init_driver(headless=False):
     """Initialize the Selenium WebDriver"""
     try:
         # Set up Chrome options
         chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
+        if headless:
+            # Lighter browser for CI/automation runs where nobody watches the window
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--window-size=1366,768")
+        else:
+            chrome_options.add_argument("--start-maximized")
         chrome_options.add_argument("--disable-popup-blocking")
         
         # Initialize Chrome WebDriver
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), 
-                                options=chrome_options)
+        try:
+            driver = webdriver.Chrome(service=Service(get_chromedriver_path()), 
+                                    options=chrome_options)
+        except Exception:
+            # The cached driver may no longer match the installed Chrome, resolve it again
+            driver = webdriver.Chrome(service=Service(get_chromedriver_path(refresh=True)), 
+                                    options=chrome_options)
         return driver
     except Exception as e:
         print(f"Failed to initialize WebDriver: {e}")
@@ -583,72 +680,74 @@ def login(driver, email, password, slow_mode=True):
         
         # Click on Login tab in sidebar
         wait = WebDriverWait(driver, WAIT_TIME)
-        tabs = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".stTabs [role='tab']")))
-        tabs[0].click()  # Login tab
-        
-        if slow_mode:
-            time.sleep(1)
-        
-        # Fill in login form
-        email_input = driver.find_element(By.CSS_SELECTOR, "input[aria-label='login_email']")
-        scroll_to_element(driver, email_input)
-        highlight_element(driver, email_input)
-        email_input.clear()
-        email_input.send_keys(email)
-        
-        if slow_mode:
-            time.sleep(0.5)
-        
-        password_input = driver.find_element(By.CSS_SELECTOR, "input[aria-label='login_password']")
-        scroll_to_element(driver, password_input)
-        highlight_element(driver, password_input)
-        password_input.clear()
-        password_input.send_keys(password)
-        
-        if slow_mode:
-            time.sleep(1)
-        
-        # Click Login button
-        login_button = driver.find_element(By.XPATH, "//button[text()='Login']")
-        scroll_to_element(driver, login_button)
-        highlight_element(driver, login_button)
-        login_button.click()
+        tabs = wait.until(EC.presence_of_all_elements_located(LOGIN_TABS_LOCATOR))
+        
+        # Without slow mode there is nothing to show, so do the whole form in one script call
+        submitted = False
+        if not slow_mode:
+            result = driver.execute_script(LOGIN_JS_BUNDLE, email, password) or {}
+            submitted = result.get("ok", False)
+            if not submitted:
+                print(f"⚠️ Scripted login unavailable ({result.get('reason', 'unknown')}), filling the form step by step")
+        
+        if not submitted:
+            tabs[0].click()  # Login tab
+            
+            if slow_mode:
+                time.sleep(1)
+            
+            # Fill in login form
+            email_input = driver.find_element(*LOGIN_EMAIL_LOCATOR)
+            if slow_mode:
+                scroll_to_element(driver, email_input)
+                highlight_element(driver, email_input)
+                email_input.clear()
+                email_input.send_keys(email)
+            else:
+                fill_input(driver, email_input, email)
+            
+            if slow_mode:
+                time.sleep(0.5)
+            
+            password_input = driver.find_element(*LOGIN_PASSWORD_LOCATOR)
+            if slow_mode:
+                scroll_to_element(driver, password_input)
+                highlight_element(driver, password_input)
+                password_input.clear()
+                password_input.send_keys(password)
+            else:
+                fill_input(driver, password_input, password)
+            
+            if slow_mode:
+                time.sleep(1)
+            
+            # Click Login button
+            login_button = driver.find_element(*LOGIN_BUTTON_LOCATOR)
+            if slow_mode:
+                scroll_to_element(driver, login_button)
+                highlight_element(driver, login_button)
+            login_button.click()
         
-        # Wait for successful login
+        # Wait for successful login: either the welcome message or an element
+        # that only appears once logged in, whichever shows up first
         try:
-            # Look for welcome message or main app content
-            success_element = WebDriverWait(driver, WAIT_TIME).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Login successful')]"))
-            )
-            highlight_element(driver, success_element, 2)
+            success_element = WebDriverWait(driver, WAIT_TIME).until(LOGIN_SUCCESS_CONDITION)
             print(f"✅ Login successful for {email}")
             
             if slow_mode:
+                highlight_element(driver, success_element, 2)
                 time.sleep(3)  # Let user see the success message
             
             return True
             
         except TimeoutException:
-            # Alternative check: look for elements that appear after successful login
+            print(f"❌ Login failed for {email}")
             try:
-                logout_element = WebDriverWait(driver, WAIT_TIME).until(
-                    EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Logout')]"))
-                )
-                highlight_element(driver, logout_element)
-                print(f"✅ Login successful for {email}")
-                
-                if slow_mode:
-                    time.sleep(3)
-                
-                return True
-            except TimeoutException:
-                print(f"❌ Login failed for {email}")
-                try:
-                    error_msg = driver.find_element(By.XPATH, "//div[contains(@class, 'stAlert')]").text
-                    print(f"Error: {error_msg}")
-                except:
-                    pass
-                return False
+                error_msg = driver.find_element(*LOGIN_ERROR_LOCATOR).text
+                print(f"Error: {error_msg}")
+            except:
+                pass
+            return False
             
     except Exception as e:
         print(f"❌ Error during login: {e}")
@@ -796,14 +895,18 @@ def main():
     parser.add_argument("--candidate-only", action="store_true", help="Run only candidate demo")
     parser.add_argument("--employer-only", action="store_true", help="Run only employer demo")
     parser.add_argument("--screenshots-dir", type=str, help="Directory to save screenshots", default=".")
+    parser.add_argument("--headless", action="store_true", help="Run Chrome headless (default when not attached to a terminal)")
+    parser.add_argument("--full-browser", action="store_true", help="Always open a visible browser window")
     args = parser.parse_args()
     
     # Use slow mode by default (for better visualization)
     slow_mode = not args.no_slow
     
+    # Nobody can watch the browser in CI, so default to headless there
+    headless = not args.full_browser and (args.headless or not sys.stdout.isatty())
+    
     # Create screenshots directory if it doesn't exist
-    if not os.path.exists(args.screenshots_dir):
-        os.makedirs(args.screenshots_dir)
+    os.makedirs(args.screenshots_dir, exist_ok=True)
     
     # Register signal handler for cleanup
     signal.signal(signal.SIGINT, lambda sig, frame: cleanup())
@@ -815,7 +918,7 @@ def main():
             return
         
         # Initialize WebDriver
-        driver = init_driver()
+        driver = init_driver(headless=headless)
         if not driver:
             print("❌ Failed to initialize WebDriver.")
             cleanup()
@@ -92,8 +92,6 @@ def random_email():
 
 def take_screenshot(driver, name):
     """Take a screenshot and save it to the screenshots directory"""
-    if not os.path.exists(SCREENSHOTS_DIR):
-        os.makedirs(SCREENSHOTS_DIR)
     filename = f"{SCREENSHOTS_DIR}/{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
     driver.save_screenshot(filename)
     print(f"📸 Screenshot saved: {filename}")
@@ -402,6 +400,7 @@ def main():
     # Set screenshots directory
     global SCREENSHOTS_DIR
     SCREENSHOTS_DIR = args.screenshots_dir
+    os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
     
     # Use existing accounts if specified
     if args.use_existing:
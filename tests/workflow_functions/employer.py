@@ -14,13 +14,13 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 
+SCREENSHOTS_DIR = "screenshots"
+os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+
 # Helper functions
 def take_screenshot(driver, name):
     """Take a screenshot and save it to the screenshots directory"""
-    screenshots_dir = "screenshots"
-    if not os.path.exists(screenshots_dir):
-        os.makedirs(screenshots_dir)
-    filename = f"{screenshots_dir}/employer_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+    filename = f"{SCREENSHOTS_DIR}/employer_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
     driver.save_screenshot(filename)
     print(f"📸 Screenshot saved: {filename}")
     return filename
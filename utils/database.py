@@ -1,3 +1,4 @@
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import MongoClient
 from typing import Optional
@@ -87,61 +88,55 @@ async def init_db():
         
         print("All collections initialized successfully")
         
-        # Create indexes for better query performance
-        # Users collection
-        await db[USERS_COLLECTION].create_index("email", unique=True)
-        await db[USERS_COLLECTION].create_index("id", unique=True)
-        
-        # Jobs collection
-        await db[JOBS_COLLECTION].create_index("id", unique=True)
-        await db[JOBS_COLLECTION].create_index("employer_id")
-        
-        # Candidates collection
-        await db[CANDIDATES_COLLECTION].create_index("id", unique=True)
-        await db[CANDIDATES_COLLECTION].create_index("email", unique=True)
-        
-        # Employers collection
-        await db[EMPLOYERS_COLLECTION].create_index("id", unique=True)
-        await db[EMPLOYERS_COLLECTION].create_index("email", unique=True)
-        
-        # Job applications collection
-        await db[JOB_APPLICATIONS_COLLECTION].create_index("id", unique=True)
-        await db[JOB_APPLICATIONS_COLLECTION].create_index("candidate_id")
-        await db[JOB_APPLICATIONS_COLLECTION].create_index("job_id")
-        await db[JOB_APPLICATIONS_COLLECTION].create_index([("candidate_id", 1), ("job_id", 1)], unique=True)
-        
-        # Saved jobs collection
-        await db[SAVED_JOBS_COLLECTION].create_index("id", unique=True)
-        await db[SAVED_JOBS_COLLECTION].create_index("candidate_id")
-        await db[SAVED_JOBS_COLLECTION].create_index("job_id")
-        await db[SAVED_JOBS_COLLECTION].create_index([("candidate_id", 1), ("job_id", 1)], unique=True)
-        
-        # Project applications collection
-        await db[PROJECT_APPLICATIONS_COLLECTION].create_index("id", unique=True)
-        await db[PROJECT_APPLICATIONS_COLLECTION].create_index("candidate_id")
-        await db[PROJECT_APPLICATIONS_COLLECTION].create_index("project_id")
-        await db[PROJECT_APPLICATIONS_COLLECTION].create_index([("candidate_id", 1), ("project_id", 1)], unique=True)
-        
-        # Saved projects collection
-        await db[SAVED_PROJECTS_COLLECTION].create_index("id", unique=True)
-        await db[SAVED_PROJECTS_COLLECTION].create_index("candidate_id")
-        await db[SAVED_PROJECTS_COLLECTION].create_index("project_id")
-        await db[SAVED_PROJECTS_COLLECTION].create_index([("candidate_id", 1), ("project_id", 1)], unique=True)
-        
-        # Feedback collection
-        await db[FEEDBACK_COLLECTION].create_index("id", unique=True)
-        await db[FEEDBACK_COLLECTION].create_index("user_id")
-        await db[FEEDBACK_COLLECTION].create_index("created_at")
-        
-        # Notifications collection
-        await db[NOTIFICATIONS_COLLECTION].create_index("id", unique=True)
-        await db[NOTIFICATIONS_COLLECTION].create_index("user_id")
-        await db[NOTIFICATIONS_COLLECTION].create_index("created_at")
-        await db[NOTIFICATIONS_COLLECTION].create_index("read", sparse=True)
-        
-        # Vector indexes collection
-        await db[VECTOR_INDEXES_COLLECTION].create_index("collection_name")
-        await db[VECTOR_INDEXES_COLLECTION].create_index("vector_type")
+        # Create indexes for better query performance.
+        # create_index is idempotent and each call is its own server round-trip,
+        # so issue them all concurrently instead of one after another.
+        await asyncio.gather(
+            # Users collection
+            db[USERS_COLLECTION].create_index("email", unique=True),
+            db[USERS_COLLECTION].create_index("id", unique=True),
+            # Jobs collection
+            db[JOBS_COLLECTION].create_index("id", unique=True),
+            db[JOBS_COLLECTION].create_index("employer_id"),
+            # Candidates collection
+            db[CANDIDATES_COLLECTION].create_index("id", unique=True),
+            db[CANDIDATES_COLLECTION].create_index("email", unique=True),
+            # Employers collection
+            db[EMPLOYERS_COLLECTION].create_index("id", unique=True),
+            db[EMPLOYERS_COLLECTION].create_index("email", unique=True),
+            # Job applications collection
+            db[JOB_APPLICATIONS_COLLECTION].create_index("id", unique=True),
+            db[JOB_APPLICATIONS_COLLECTION].create_index("candidate_id"),
+            db[JOB_APPLICATIONS_COLLECTION].create_index("job_id"),
+            db[JOB_APPLICATIONS_COLLECTION].create_index([("candidate_id", 1), ("job_id", 1)], unique=True),
+            # Saved jobs collection
+            db[SAVED_JOBS_COLLECTION].create_index("id", unique=True),
+            db[SAVED_JOBS_COLLECTION].create_index("candidate_id"),
+            db[SAVED_JOBS_COLLECTION].create_index("job_id"),
+            db[SAVED_JOBS_COLLECTION].create_index([("candidate_id", 1), ("job_id", 1)], unique=True),
+            # Project applications collection
+            db[PROJECT_APPLICATIONS_COLLECTION].create_index("id", unique=True),
+            db[PROJECT_APPLICATIONS_COLLECTION].create_index("candidate_id"),
+            db[PROJECT_APPLICATIONS_COLLECTION].create_index("project_id"),
+            db[PROJECT_APPLICATIONS_COLLECTION].create_index([("candidate_id", 1), ("project_id", 1)], unique=True),
+            # Saved projects collection
+            db[SAVED_PROJECTS_COLLECTION].create_index("id", unique=True),
+            db[SAVED_PROJECTS_COLLECTION].create_index("candidate_id"),
+            db[SAVED_PROJECTS_COLLECTION].create_index("project_id"),
+            db[SAVED_PROJECTS_COLLECTION].create_index([("candidate_id", 1), ("project_id", 1)], unique=True),
+            # Feedback collection
+            db[FEEDBACK_COLLECTION].create_index("id", unique=True),
+            db[FEEDBACK_COLLECTION].create_index("user_id"),
+            db[FEEDBACK_COLLECTION].create_index("created_at"),
+            # Notifications collection
+            db[NOTIFICATIONS_COLLECTION].create_index("id", unique=True),
+            db[NOTIFICATIONS_COLLECTION].create_index("user_id"),
+            db[NOTIFICATIONS_COLLECTION].create_index("created_at"),
+            db[NOTIFICATIONS_COLLECTION].create_index("read", sparse=True),
+            # Vector indexes collection
+            db[VECTOR_INDEXES_COLLECTION].create_index("collection_name"),
+            db[VECTOR_INDEXES_COLLECTION].create_index("vector_type")
+        )
         
         print("All indexes created successfully")
         